@@ -14,13 +14,66 @@
 
 from __future__ import annotations
 
+import fnmatch
+import re
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+from ..exceptions import CacheBackendError
+
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from ..types import CacheKey, CacheValue, KeysPage
 
 
+@lru_cache(maxsize=128)
+def compile_key_pattern(pattern: str) -> Callable[[str], re.Match[str] | None]:
+    """
+    将 keys() 的通配符模式编译为匹配函数
+
+    通配符语义与 fnmatch 一致（* ? [seq]），区分大小写；
+    编译结果按模式缓存，扫描时每个键只需一次正则匹配。
+
+    Args:
+        pattern: 通配符模式
+
+    Returns:
+        匹配函数，匹配成功返回 Match 对象，否则返回 None
+
+    示例:
+        >>> match = compile_key_pattern("user:*")
+        >>> bool(match("user:1"))
+        True
+    """
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+def filter_keys(pattern: str, keys: Iterable[str]) -> list[str]:
+    """
+    按通配符模式过滤键列表
+
+    形如 "prefix*" 且前缀不含其他通配符的模式直接用 str.startswith 过滤，
+    比逐键正则匹配更快；其余模式使用 compile_key_pattern 的缓存正则。
+
+    Args:
+        pattern: 通配符模式
+        keys: 待过滤的键
+
+    Returns:
+        匹配的键列表（保持原顺序）
+
+    示例:
+        >>> filter_keys("user:*", ["user:1", "item:1"])
+        ['user:1']
+    """
+    prefix = pattern[:-1]
+    if pattern.endswith("*") and not any(char in prefix for char in "*?["):
+        return [key for key in keys if key.startswith(prefix)]
+    return list(filter(compile_key_pattern(pattern), keys))
+
+
 class BaseBackend(ABC):
     """
     缓存后端抽象基类
@@ -32,6 +85,7 @@ class BaseBackend(ABC):
     1. 基础操作：get/set/delete/exists/clear（必须实现）
     2. 异步操作：aget/aset/adelete（必须实现）
     3. 批量操作：get_many/set_many/delete_many（可选，有默认实现）
+    4. 计数器操作：incr/aincr（可选，有默认实现）
 
     使用示例：
         >>> backend = MemoryBackend()
@@ -341,6 +395,70 @@ class BaseBackend(ABC):
                 count += 1
         return count
 
+    # ========== 计数器操作（可选，有默认实现）==========
+
+    def incr(self, key: CacheKey, delta: int = 1) -> int:
+        """
+        自增计数器(同步)
+
+        不存在的键从 0 开始计数。
+
+        Args:
+            key: 缓存键
+            delta: 增量(默认 1)
+
+        Returns:
+            自增后的值
+
+        Raises:
+            ValueError: 当前值不是整数
+            CacheBackendError: 后端操作失败
+        """
+        # 默认实现:读取后写回,非原子且不保留过期时间
+        # 子类应该重写此方法提供原子实现
+        current = self.get(key)
+        if current is None:
+            current = 0
+
+        if not isinstance(current, int):
+            msg = f"键 {key!r} 的值不是整数类型: {type(current)}"
+            raise ValueError(msg)
+
+        new_value = current + delta
+        if not self.set(key, new_value):
+            msg = f"键 {key!r} 未能写入缓存，自增失败"
+            raise CacheBackendError(msg)
+        return new_value
+
+    async def aincr(self, key: CacheKey, delta: int = 1) -> int:
+        """
+        自增计数器(异步)
+
+        Args:
+            key: 缓存键
+            delta: 增量(默认 1)
+
+        Returns:
+            自增后的值
+
+        Raises:
+            ValueError: 当前值不是整数
+            CacheBackendError: 后端操作失败
+        """
+        current = await self.aget(key)
+        if current is None:
+            current = 0
+
+        if not isinstance(current, int):
+            msg = f"键 {key!r} 的值不是整数类型: {type(current)}"
+            raise ValueError(msg)
+
+        new_value = current + delta
+        if not await self.aset(key, new_value):
+            msg = f"键 {key!r} 未能写入缓存，自增失败"
+            raise CacheBackendError(msg)
+        return new_value
+
     # ========== 扩展操作 ==========
 
     def keys(
@@ -19,22 +19,28 @@
 
 from __future__ import annotations
 
+import contextlib
 import sqlite3
 import threading
 import time
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 import aiosqlite
 
 from ..exceptions import CacheBackendError
 from ..serializers import get_serializer
 from ..types import SerializationMode
-from .base import BaseBackend
+from .base import BaseBackend, filter_keys
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from ..types import CacheKey, CacheValue, KeysPage
 
+# 批量操作每条 SQL 的最大参数个数（低于 SQLite 旧版本 999 个变量的上限）
+_BATCH_CHUNK_SIZE = 500
+
 
 class FileBackend(BaseBackend):
     """
@@ -69,6 +75,8 @@ class FileBackend(BaseBackend):
         serialization_mode: SerializationMode | str = SerializationMode.PICKLE,
         cleanup_interval: int = 300,  # 5 分钟
         enable_hot_reload: bool = False,
+        pragmas: dict[str, str | int] | None = None,
+        time_func: Callable[[], float] = time.time,
     ) -> None:
         """
         初始化文件后端
@@ -79,6 +87,14 @@ class FileBackend(BaseBackend):
             serialization_mode: 序列化模式
             cleanup_interval: 清理间隔（秒）
             enable_hot_reload: 是否启用热重载（开发模式）
+            pragmas: 额外的 SQLite PRAGMA（作用于同步连接，覆盖默认值），
+                例如可重建的缓存/测试环境可关闭持久性：
+                {"synchronous": "OFF", "journal_mode": "MEMORY"}
+            time_func: 时间来源（默认 time.time）；过期时间持久化到数据库，
+                需跨进程一致，因此使用墙上时钟。测试中可注入模拟时钟
+
+        Raises:
+            ValueError: PRAGMA 名称或取值不合法
 
         示例：
             >>> backend = FileBackend(
@@ -86,15 +102,27 @@ class FileBackend(BaseBackend):
             ...     enable_hot_reload=True,  # 开发环境
             ... )
         """
+        for name, value in (pragmas or {}).items():
+            if not name.isidentifier() or not str(value).lstrip("-").isalnum():
+                msg = f"不合法的 PRAGMA: {name}={value}"
+                raise ValueError(msg)
+        self._pragmas = dict(pragmas or {})
+
         self._db_path = Path(db_path)
         self._max_size = max_size
         self._serializer = get_serializer(serialization_mode)
         self._cleanup_interval = cleanup_interval
         self._enable_hot_reload = enable_hot_reload
+        self._time = time_func
 
-        # 线程锁（保护同步操作）
+        # 线程锁（保护同步操作及共享连接）
         self._lock = threading.RLock()
 
+        # 同步操作共用的持久连接（由 _lock 串行化访问），
+        # 复用 sqlite3 的预编译语句缓存，避免每次操作重新打开数据库
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = self._connect()
+
         # 初始化数据库
         self._init_database()
 
@@ -115,13 +143,11 @@ class FileBackend(BaseBackend):
 
         创建表结构和索引，启用 WAL 模式。
         """
-        # 确保父目录存在
-        self._db_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with sqlite3.connect(self._db_path) as conn:
+        with self._conn as conn:
             # 启用 WAL 模式（Write-Ahead Logging）
-            # 提升并发性能，允许读写并行
-            conn.execute("PRAGMA journal_mode=WAL")
+            # 提升并发性能，允许读写并行（用户通过 pragmas 指定时以其为准）
+            if "journal_mode" not in self._pragmas:
+                conn.execute("PRAGMA journal_mode=WAL")
 
             # 启用外键约束
             conn.execute("PRAGMA foreign_keys=ON")
@@ -157,6 +183,26 @@ class FileBackend(BaseBackend):
 
             conn.commit()
 
+    def _connect(self) -> sqlite3.Connection:
+        """
+        创建同步连接并设置连接级 PRAGMA
+
+        - synchronous=NORMAL：WAL 模式下仍保证一致性，提交时不再每次 fsync
+        - mmap_size：读取经内存映射，减少 read() 系统调用与拷贝
+        - cache_size：64MB 页缓存
+        - temp_store=MEMORY：临时表与排序使用内存
+
+        构造参数 pragmas 中的设置最后应用，覆盖上述默认值。
+        """
+        conn = sqlite3.connect(self._db_path, check_same_thread=False)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        for name, value in self._pragmas.items():
+            conn.execute(f"PRAGMA {name}={value}")
+        return conn
+
     # ========== 同步基础操作 ==========
 
     def get(self, key: CacheKey) -> CacheValue | None:
@@ -180,7 +226,7 @@ class FileBackend(BaseBackend):
             self._check_hot_reload()
 
         with self._lock:
-            conn = sqlite3.connect(self._db_path)
+            conn = self._conn
             try:
                 cursor = conn.execute(
                     "SELECT value, expires_at FROM cache_entries WHERE key = ?",
@@ -194,7 +240,7 @@ class FileBackend(BaseBackend):
                 value_bytes, expires_at = row
 
                 # 检查是否过期
-                if expires_at is not None and time.time() > expires_at:
+                if expires_at is not None and self._time() > expires_at:
                     # 已过期，删除
                     conn.execute("DELETE FROM cache_entries WHERE key = ?", (str(key),))
                     conn.commit()
@@ -203,15 +249,16 @@ class FileBackend(BaseBackend):
                 # 更新 last_access（LRU）
                 conn.execute(
                     "UPDATE cache_entries SET last_access = ? WHERE key = ?",
-                    (time.time(), str(key)),
+                    (self._time(), str(key)),
                 )
                 conn.commit()
 
                 # 反序列化
                 return self._serializer.deserialize(value_bytes)
-
-            finally:
-                conn.close()
+            except Exception:
+                # 持久连接需回滚未提交的事务，避免影响后续操作
+                conn.rollback()
+                raise
 
     async def aget(self, key: CacheKey) -> CacheValue | None:
         """
@@ -236,7 +283,7 @@ class FileBackend(BaseBackend):
             value_bytes, expires_at = row
 
             # 检查过期
-            if expires_at is not None and time.time() > expires_at:
+            if expires_at is not None and self._time() > expires_at:
                 await conn.execute("DELETE FROM cache_entries WHERE key = ?", (str(key),))
                 await conn.commit()
                 return None
@@ -244,7 +291,7 @@ class FileBackend(BaseBackend):
             # 更新 last_access
             await conn.execute(
                 "UPDATE cache_entries SET last_access = ? WHERE key = ?",
-                (time.time(), str(key)),
+                (self._time(), str(key)),
             )
             await conn.commit()
 
@@ -272,13 +319,13 @@ class FileBackend(BaseBackend):
             是否设置成功
         """
         with self._lock:
-            conn = sqlite3.connect(self._db_path)
+            conn = self._conn
             try:
                 # 序列化值
                 serialized_value = self._serializer.serialize(value)
 
                 # 计算过期时间
-                now = time.time()
+                now = self._time()
                 expires_at = None if ttl is None else now + ttl
 
                 # NX 模式检查
@@ -312,8 +359,6 @@ class FileBackend(BaseBackend):
                 conn.rollback()
                 msg = f"设置缓存失败: {key}"
                 raise CacheBackendError(msg) from e
-            finally:
-                conn.close()
 
     async def aset(
         self,
@@ -342,7 +387,7 @@ class FileBackend(BaseBackend):
                 serialized_value = self._serializer.serialize(value)
 
                 # 计算过期时间
-                now = time.time()
+                now = self._time()
                 expires_at = None if ttl is None else now + ttl
 
                 # NX 模式检查
@@ -378,10 +423,223 @@ class FileBackend(BaseBackend):
                 msg = f"异步设置缓存失败: {key}"
                 raise CacheBackendError(msg) from e
 
+    def set_many(
+        self,
+        mapping: dict[CacheKey, CacheValue],
+        ttl: int | None = None,
+    ) -> None:
+        """
+        批量设置缓存值
+
+        所有写入在同一事务内完成，整批只提交（fsync）一次，
+        LRU 淘汰也只在批次末尾执行一次。
+
+        Args:
+            mapping: 键值对字典
+            ttl: 过期时间(秒)
+        """
+        if not mapping:
+            return
+
+        with self._lock:
+            conn = self._conn
+            try:
+                now = self._time()
+                expires_at = None if ttl is None else now + ttl
+                serialize = self._serializer.serialize
+                rows = [
+                    (key, serialize(value), expires_at, now, now) for key, value in mapping.items()
+                ]
+
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO cache_entries
+                    (key, value, expires_at, last_access, created_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+
+                self._evict_if_needed(conn)
+                conn.commit()
+
+            except Exception as e:
+                conn.rollback()
+                msg = f"批量设置缓存失败: {len(mapping)} 个键"
+                raise CacheBackendError(msg) from e
+
+    async def aset_many(
+        self,
+        mapping: dict[CacheKey, CacheValue],
+        ttl: int | None = None,
+    ) -> None:
+        """
+        异步批量设置缓存值
+
+        所有写入在同一事务内完成，整批只提交（fsync）一次。
+
+        Args:
+            mapping: 键值对字典
+            ttl: 过期时间(秒)
+        """
+        if not mapping:
+            return
+
+        async with aiosqlite.connect(self._db_path) as conn:
+            try:
+                now = self._time()
+                expires_at = None if ttl is None else now + ttl
+                serialize = self._serializer.serialize
+                rows = [
+                    (key, serialize(value), expires_at, now, now) for key, value in mapping.items()
+                ]
+
+                await conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO cache_entries
+                    (key, value, expires_at, last_access, created_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+
+                await self._aevict_if_needed(conn)
+                await conn.commit()
+
+            except Exception as e:
+                await conn.rollback()
+                msg = f"异步批量设置缓存失败: {len(mapping)} 个键"
+                raise CacheBackendError(msg) from e
+
+    def get_many(self, keys: list[CacheKey]) -> dict[CacheKey, CacheValue]:
+        """
+        批量获取缓存值
+
+        以 WHERE key IN (...) 分块查询，过期键的删除与命中键的 last_access
+        更新各合并为一次 executemany，整批只提交一次。
+
+        Args:
+            keys: 缓存键列表
+
+        Returns:
+            键值对字典，不存在或已过期的键不包含在结果中
+        """
+        if not keys:
+            return {}
+
+        # 热重载检测
+        if self._enable_hot_reload:
+            self._check_hot_reload()
+
+        # 数据库中的键为字符串，结果需还原为调用方传入的键
+        originals = {str(key): key for key in keys}
+        names = list(originals)
+
+        with self._lock:
+            conn = self._conn
+            try:
+                rows: list[tuple[str, bytes, float | None]] = []
+                for start in range(0, len(names), _BATCH_CHUNK_SIZE):
+                    chunk = names[start : start + _BATCH_CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor = conn.execute(
+                        "SELECT key, value, expires_at FROM cache_entries "
+                        f"WHERE key IN ({placeholders})",
+                        chunk,
+                    )
+                    rows.extend(cursor.fetchall())
+
+                now = self._time()
+                hits = [
+                    (key, value)
+                    for key, value, expires_at in rows
+                    if expires_at is None or now <= expires_at
+                ]
+                expired = [
+                    (key,)
+                    for key, _, expires_at in rows
+                    if expires_at is not None and now > expires_at
+                ]
+
+                if expired:
+                    conn.executemany("DELETE FROM cache_entries WHERE key = ?", expired)
+                if hits:
+                    conn.executemany(
+                        "UPDATE cache_entries SET last_access = ? WHERE key = ?",
+                        [(now, key) for key, _ in hits],
+                    )
+                if expired or hits:
+                    conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+        deserialize = self._serializer.deserialize
+        return {originals[key]: deserialize(value) for key, value in hits}
+
+    async def aget_many(self, keys: list[CacheKey]) -> dict[CacheKey, CacheValue]:
+        """
+        异步批量获取缓存值
+
+        与 get_many 相同的分块查询，整批共用一个 aiosqlite 连接与一次提交。
+
+        Args:
+            keys: 缓存键列表
+
+        Returns:
+            键值对字典，不存在或已过期的键不包含在结果中
+        """
+        if not keys:
+            return {}
+
+        # 热重载检测
+        if self._enable_hot_reload:
+            self._check_hot_reload()
+
+        originals = {str(key): key for key in keys}
+        names = list(originals)
+
+        async with aiosqlite.connect(self._db_path) as conn:
+            rows: list[tuple[str, bytes, float | None]] = []
+            for start in range(0, len(names), _BATCH_CHUNK_SIZE):
+                chunk = names[start : start + _BATCH_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = await conn.execute(
+                    f"SELECT key, value, expires_at FROM cache_entries WHERE key IN ({placeholders})",
+                    chunk,
+                )
+                # 未设置 row_factory，行即普通元组
+                rows.extend(
+                    cast("Iterable[tuple[str, bytes, float | None]]", await cursor.fetchall())
+                )
+
+            now = self._time()
+            hits = [
+                (key, value)
+                for key, value, expires_at in rows
+                if expires_at is None or now <= expires_at
+            ]
+            expired = [
+                (key,) for key, _, expires_at in rows if expires_at is not None and now > expires_at
+            ]
+
+            if expired:
+                await conn.executemany("DELETE FROM cache_entries WHERE key = ?", expired)
+            if hits:
+                await conn.executemany(
+                    "UPDATE cache_entries SET last_access = ? WHERE key = ?",
+                    [(now, key) for key, _ in hits],
+                )
+            if expired or hits:
+                await conn.commit()
+
+        deserialize = self._serializer.deserialize
+        return {originals[key]: deserialize(value) for key, value in hits}
+
     def delete(self, key: CacheKey) -> bool:
         """删除缓存"""
         with self._lock:
-            conn = sqlite3.connect(self._db_path)
+            conn = self._conn
             try:
                 cursor = conn.execute(
                     "DELETE FROM cache_entries WHERE key = ?",
@@ -389,8 +647,9 @@ class FileBackend(BaseBackend):
                 )
                 conn.commit()
                 return cursor.rowcount > 0
-            finally:
-                conn.close()
+            except Exception:
+                conn.rollback()
+                raise
 
     async def adelete(self, key: CacheKey) -> bool:
         """异步删除缓存"""
@@ -402,6 +661,182 @@ class FileBackend(BaseBackend):
             await conn.commit()
             return cursor.rowcount > 0
 
+    def delete_many(self, keys: list[CacheKey]) -> int:
+        """
+        批量删除缓存
+
+        以 WHERE key IN (...) 分块删除，整批只提交一次。
+
+        Args:
+            keys: 缓存键列表
+
+        Returns:
+            实际删除的键数量
+        """
+        names = list({str(key): None for key in keys})
+        if not names:
+            return 0
+
+        with self._lock:
+            conn = self._conn
+            try:
+                deleted = 0
+                for start in range(0, len(names), _BATCH_CHUNK_SIZE):
+                    chunk = names[start : start + _BATCH_CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor = conn.execute(
+                        f"DELETE FROM cache_entries WHERE key IN ({placeholders})", chunk
+                    )
+                    deleted += cursor.rowcount
+                conn.commit()
+                return deleted
+            except Exception:
+                conn.rollback()
+                raise
+
+    async def adelete_many(self, keys: list[CacheKey]) -> int:
+        """
+        异步批量删除缓存
+
+        Args:
+            keys: 缓存键列表
+
+        Returns:
+            实际删除的键数量
+        """
+        names = list({str(key): None for key in keys})
+        if not names:
+            return 0
+
+        async with aiosqlite.connect(self._db_path) as conn:
+            deleted = 0
+            for start in range(0, len(names), _BATCH_CHUNK_SIZE):
+                chunk = names[start : start + _BATCH_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = await conn.execute(
+                    f"DELETE FROM cache_entries WHERE key IN ({placeholders})", chunk
+                )
+                deleted += cursor.rowcount
+            await conn.commit()
+            return deleted
+
+    def incr(self, key: CacheKey, delta: int = 1) -> int:
+        """
+        原子自增
+
+        在 BEGIN IMMEDIATE 事务内读取并写回，跨连接、跨进程同样原子；
+        已存在的键保留原有过期时间，不存在或已过期的键从 0 开始计数（永不过期）。
+
+        Args:
+            key: 缓存键
+            delta: 增量（默认 1）
+
+        Returns:
+            自增后的值
+
+        Raises:
+            ValueError: 当前值不是整数
+            CacheBackendError: 后端操作失败
+        """
+        with self._lock:
+            conn = self._conn
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                now = self._time()
+                row = conn.execute(
+                    "SELECT value, expires_at FROM cache_entries WHERE key = ?", (str(key),)
+                ).fetchone()
+
+                if row is None or (row[1] is not None and now > row[1]):
+                    value = delta
+                    conn.execute(
+                        """
+                        INSERT OR REPLACE INTO cache_entries
+                        (key, value, expires_at, last_access, created_at)
+                        VALUES (?, ?, NULL, ?, ?)
+                        """,
+                        (str(key), self._serializer.serialize(value), now, now),
+                    )
+                    self._evict_if_needed(conn)
+                else:
+                    current = self._serializer.deserialize(row[0])
+                    if not isinstance(current, int):
+                        msg = f"键 {key!r} 的值不是整数类型: {type(current)}"
+                        raise ValueError(msg)
+                    value = current + delta
+                    conn.execute(
+                        "UPDATE cache_entries SET value = ?, last_access = ? WHERE key = ?",
+                        (self._serializer.serialize(value), now, str(key)),
+                    )
+
+                conn.commit()
+                return value
+
+            except ValueError:
+                conn.rollback()
+                raise
+            except Exception as e:
+                conn.rollback()
+                msg = f"自增失败: {key!r}"
+                raise CacheBackendError(msg) from e
+
+    async def aincr(self, key: CacheKey, delta: int = 1) -> int:
+        """
+        异步原子自增
+
+        Args:
+            key: 缓存键
+            delta: 增量（默认 1）
+
+        Returns:
+            自增后的值
+
+        Raises:
+            ValueError: 当前值不是整数
+            CacheBackendError: 后端操作失败
+        """
+        async with aiosqlite.connect(self._db_path) as conn:
+            try:
+                await conn.execute("BEGIN IMMEDIATE")
+                now = self._time()
+                cursor = await conn.execute(
+                    "SELECT value, expires_at FROM cache_entries WHERE key = ?", (str(key),)
+                )
+                row = await cursor.fetchone()
+
+                if row is None or (row[1] is not None and now > row[1]):
+                    value = delta
+                    await conn.execute(
+                        """
+                        INSERT OR REPLACE INTO cache_entries
+                        (key, value, expires_at, last_access, created_at)
+                        VALUES (?, ?, NULL, ?, ?)
+                        """,
+                        (str(key), self._serializer.serialize(value), now, now),
+                    )
+                    await self._aevict_if_needed(conn)
+                else:
+                    current = self._serializer.deserialize(row[0])
+                    if not isinstance(current, int):
+                        msg = f"键 {key!r} 的值不是整数类型: {type(current)}"
+                        raise ValueError(msg)
+                    value = current + delta
+                    await conn.execute(
+                        "UPDATE cache_entries SET value = ?, last_access = ? WHERE key = ?",
+                        (self._serializer.serialize(value), now, str(key)),
+                    )
+
+                await conn.commit()
+                return value
+
+            except ValueError:
+                await conn.rollback()
+                raise
+            except Exception as e:
+                await conn.rollback()
+                msg = f"异步自增失败: {key!r}"
+                raise CacheBackendError(msg) from e
+
     def exists(self, key: CacheKey) -> bool:
         """检查键是否存在（未过期）"""
         return self.get(key) is not None
@@ -409,12 +844,13 @@ class FileBackend(BaseBackend):
     def clear(self) -> None:
         """清空所有缓存"""
         with self._lock:
-            conn = sqlite3.connect(self._db_path)
+            conn = self._conn
             try:
                 conn.execute("DELETE FROM cache_entries")
                 conn.commit()
-            finally:
-                conn.close()
+            except Exception:
+                conn.rollback()
+                raise
 
     # ========== LRU 淘汰 ==========
 
@@ -485,16 +921,17 @@ class FileBackend(BaseBackend):
     def _cleanup_expired(self) -> None:
         """清理过期的缓存条目"""
         with self._lock:
-            conn = sqlite3.connect(self._db_path)
+            conn = self._conn
             try:
-                now = time.time()
+                now = self._time()
                 conn.execute(
                     "DELETE FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at < ?",
                     (now,),
                 )
                 conn.commit()
-            finally:
-                conn.close()
+            except Exception:
+                conn.rollback()
+                raise
 
     # ========== 热重载 ==========
 
@@ -539,50 +976,41 @@ class FileBackend(BaseBackend):
         Returns:
             KeysPage 对象
         """
-        import fnmatch
-
         from ..types import KeysPage
 
         with self._lock:
-            conn = sqlite3.connect(self._db_path)
-            try:
-                # 获取所有未过期的键
-                now = time.time()
-                cursor_obj = conn.execute(
-                    "SELECT key FROM cache_entries WHERE expires_at IS NULL OR expires_at > ? ORDER BY key",
-                    (now,),
-                )
-                all_keys = [row[0] for row in cursor_obj.fetchall()]
-
-                # 模式匹配
-                if pattern != "*":
-                    matched_keys = [k for k in all_keys if fnmatch.fnmatch(k, pattern)]
-                else:
-                    matched_keys = all_keys
+            conn = self._conn
+            # 获取所有未过期的键
+            now = self._time()
+            cursor_obj = conn.execute(
+                "SELECT key FROM cache_entries WHERE expires_at IS NULL OR expires_at > ? ORDER BY key",
+                (now,),
+            )
+            all_keys = [row[0] for row in cursor_obj.fetchall()]
 
-                # 分页处理
-                total = len(matched_keys)
-                start_idx = cursor
-                end_idx = start_idx + count
+            # 模式匹配
+            matched_keys = filter_keys(pattern, all_keys) if pattern != "*" else all_keys
 
-                if max_keys is not None:
-                    end_idx = min(end_idx, start_idx + max_keys)
+            # 分页处理
+            total = len(matched_keys)
+            start_idx = cursor
+            end_idx = start_idx + count
 
-                page_keys = matched_keys[start_idx:end_idx]
+            if max_keys is not None:
+                end_idx = min(end_idx, start_idx + max_keys)
 
-                # 计算下一页游标
-                next_cursor = end_idx if end_idx < total else 0
-                has_more = next_cursor > 0
+            page_keys = matched_keys[start_idx:end_idx]
 
-                return KeysPage(
-                    keys=page_keys,
-                    cursor=next_cursor,
-                    has_more=has_more,
-                    total_scanned=len(page_keys),
-                )
+            # 计算下一页游标
+            next_cursor = end_idx if end_idx < total else 0
+            has_more = next_cursor > 0
 
-            finally:
-                conn.close()
+            return KeysPage(
+                keys=page_keys,
+                cursor=next_cursor,
+                has_more=has_more,
+                total_scanned=len(page_keys),
+            )
 
     async def akeys(
         self,
@@ -594,15 +1022,26 @@ class FileBackend(BaseBackend):
         """异步扫描缓存键"""
         return self.keys(pattern=pattern, cursor=cursor, count=count, max_keys=max_keys)
 
-    def close(self) -> None:
+    def close(self, fsync: bool = True) -> None:
         """
         关闭后端连接（同步）
 
-        停止后台清理线程。
+        停止后台清理线程并关闭数据库连接。
+
+        Args:
+            fsync: 关闭时的 WAL 检查点是否落盘。数据库文件随后即被丢弃
+                （如测试中的临时库）时可传 False，跳过 fsync。
         """
         self._stop_cleanup.set()
         if self._cleanup_thread and self._cleanup_thread.is_alive():
             self._cleanup_thread.join(timeout=1.0)
+        with self._lock:
+            if not fsync:
+                # 关闭最后一个连接时 SQLite 会自动做检查点，关闭同步即可跳过 fsync；
+                # 连接已关闭（重复 close）时忽略
+                with contextlib.suppress(sqlite3.ProgrammingError):
+                    self._conn.execute("PRAGMA synchronous=OFF")
+            self._conn.close()
 
     async def aclose(self) -> None:
         """
@@ -613,12 +1052,9 @@ class FileBackend(BaseBackend):
     def __len__(self) -> int:
         """获取当前缓存条目数"""
         with self._lock:
-            conn = sqlite3.connect(self._db_path)
-            try:
-                cursor = conn.execute("SELECT COUNT(*) FROM cache_entries")
-                return cursor.fetchone()[0]
-            finally:
-                conn.close()
+            conn = self._conn
+            cursor = conn.execute("SELECT COUNT(*) FROM cache_entries")
+            return cursor.fetchone()[0]
 
     def __repr__(self) -> str:
         """字符串表示"""
@@ -626,6 +1062,9 @@ class FileBackend(BaseBackend):
 
     def __del__(self) -> None:
         """析构函数"""
+        # 构造失败（如参数校验未通过）时清理线程尚未创建
+        if not hasattr(self, "_stop_cleanup"):
+            return
         self._stop_cleanup.set()
         if self._cleanup_thread and self._cleanup_thread.is_alive():
             self._cleanup_thread.join(timeout=1.0)
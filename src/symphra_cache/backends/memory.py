@@ -6,24 +6,36 @@
 
 特性：
 - 读写延迟 < 0.01ms
-- LRU 淘汰策略（基于 OrderedDict）
-- 后台自动清理过期键
-- 线程安全（RLock 保护）
+- LRU 淘汰策略（基于 OrderedDict），可选 TinyLFU 频率准入
+- 惰性清理过期键（无后台线程）
+- 线程安全（写操作 RLock 保护，读操作无锁、互不阻塞）
 - 异步和同步双接口
 """
 
 from __future__ import annotations
 
+import math
 import threading
 import time
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from typing import TYPE_CHECKING
 
-from .base import BaseBackend
+from ..exceptions import CacheBackendError
+from ..sketch import CountMinSketch
+from ..types import EvictionPolicy
+from .base import BaseBackend, filter_keys
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from ..types import CacheKey, CacheValue, KeysPage
 
+_HIT_BUFFER_SIZE = 64
+"""读路径累积的 LRU 访问记录条数，达到后在锁内批量应用"""
+
+_BUCKET_SLACK = 64
+"""过期队列允许超出 2 倍有效条目数的余量，超出后压缩掉失效记录"""
+
 
 class MemoryBackend(BaseBackend):
     """
@@ -34,8 +46,16 @@ class MemoryBackend(BaseBackend):
     架构设计:
     - 存储结构: OrderedDict[key, (value, expires_at)]
     - LRU 实现: 访问时将键移到末尾，淘汰时删除头部
-    - TTL 管理: 惰性删除（读取时检查）+ 后台定期清理
-    - 线程安全: 所有操作使用 RLock 保护
+    - TTL 管理: 惰性删除（读取时检查）+ 写入时顺带回收（无后台线程），
+      过期时间使用单调时钟，不受系统时间跳变影响
+    - 过期队列: 按 TTL 值分组的 FIFO 队列（同一 TTL 的过期时间天然有序），
+      回收只需检查各队列头部，复杂度 O(t + 过期数)，t 为不同 TTL 的个数
+    - 线程安全: 写操作使用 RLock 保护；get/get_many 不加锁，依赖
+      OrderedDict.get 的单次原子查找，LRU 更新先写入访问缓冲区，
+      在锁内批量应用（淘汰前必定先应用，保证淘汰顺序正确）
+    - TinyLFU（可选）: Count-Min Sketch 统计访问频率（含未命中），
+      缓存已满时仅当新键的频率高于 LRU 待淘汰键时才写入，
+      一次性扫描的大量冷键不会冲掉热点数据
 
     性能特点:
     - 读取: O(1)，< 0.01ms
@@ -54,34 +74,66 @@ class MemoryBackend(BaseBackend):
         self,
         max_size: int = 10000,
         cleanup_interval: int = 60,
+        eviction_policy: EvictionPolicy | str = EvictionPolicy.LRU,
+        time_func: Callable[[], float] = time.monotonic,
     ) -> None:
         """
         初始化内存后端
 
         Args:
             max_size: 最大缓存条数，超过后触发 LRU 淘汰（默认 10000）
-            cleanup_interval: TTL 清理间隔（秒），默认 60 秒
+            cleanup_interval: 全量过期清理的最小间隔（秒），默认 60 秒；
+                清理由写操作顺带触发，不再启动后台线程
+            eviction_policy: 淘汰策略，支持 "lru"（默认）和 "tinylfu"
+            time_func: 时间来源（默认 time.monotonic，不受系统时间调整影响）；
+                测试中可注入模拟时钟
+
+        Raises:
+            ValueError: 不支持的淘汰策略
 
         示例:
             >>> # 创建最大容量 1000 的缓存
             >>> backend = MemoryBackend(max_size=1000, cleanup_interval=30)
-        """
+            >>> # 抗扫描的 TinyLFU 策略
+            >>> backend = MemoryBackend(max_size=1000, eviction_policy="tinylfu")
+        """
+        try:
+            policy = EvictionPolicy(eviction_policy)
+        except ValueError as e:
+            msg = f"不支持的淘汰策略: {eviction_policy}"
+            raise ValueError(msg) from e
+        if policy not in (EvictionPolicy.LRU, EvictionPolicy.TINYLFU):
+            msg = f"内存后端不支持的淘汰策略: {policy}"
+            raise ValueError(msg)
+
         self._max_size = max_size
         self._cleanup_interval = cleanup_interval
+        self._time = time_func
 
         # 存储格式: {key: (value, expires_at)}
         # expires_at 为 None 表示永不过期
         # 使用 OrderedDict 支持 LRU：最近访问的在末尾，最旧的在头部
         self._cache: OrderedDict[CacheKey, tuple[CacheValue, float | None]] = OrderedDict()
 
-        # 线程锁（保证线程安全）
+        # 线程锁（保护所有修改操作）
         # 使用 RLock 允许同一线程重入
         self._lock = threading.RLock()
 
-        # 启动后台清理任务
-        self._cleanup_thread: threading.Thread | None = None
-        self._stop_cleanup = threading.Event()
-        self._start_cleanup_task()
+        # 读路径的 LRU 访问记录（deque.append 线程安全），在锁内批量应用
+        self._hits: deque[CacheKey] = deque()
+
+        # 下一次由写操作顺带执行全量过期清理的时间（单调时钟）
+        self._next_sweep = self._time() + cleanup_interval
+        # 按 TTL 分组的过期队列: {ttl: deque[(expires_at, key)]}
+        # 覆盖写入或删除不修改队列，回收时核对 expires_at 跳过失效记录
+        self._ttl_buckets: dict[int, deque[tuple[float, CacheKey]]] = {}
+        # 所有队列头部中最早的过期时间，早于此时间无需回收
+        self._closest_expiration = math.inf
+
+        # TinyLFU 访问频率统计（LRU 策略下为 None），宽度与容量同阶
+        self._sketch: CountMinSketch | None = (
+            CountMinSketch(width=max(max_size, 16)) if policy is EvictionPolicy.TINYLFU else None
+        )
 
     # ========== 同步基础操作 ==========
 
@@ -109,23 +161,32 @@ class MemoryBackend(BaseBackend):
             >>> time.sleep(61)
             >>> backend.get("key")  # None（已过期）
         """
-        with self._lock:
-            # 检查键是否存在
-            if key not in self._cache:
-                return None
-
-            value, expires_at = self._cache[key]
-
-            # 检查是否过期（惰性删除）
-            if expires_at is not None and time.time() > expires_at:
-                # 已过期，删除并返回 None
-                del self._cache[key]
-                return None
+        # 无锁读取：单次原子查找同时完成存在性检查与取值
+        entry = self._cache.get(key)
+        if entry is None:
+            # TinyLFU 的频率统计也计入未命中
+            if self._sketch is not None:
+                self._record_hits((key,))
+            return None
+
+        value, expires_at = entry
+
+        # 检查是否过期（惰性删除）
+        if expires_at is not None and self._time() > expires_at:
+            # 已过期，加锁删除（确认期间未被重新写入）并返回 None
+            with self._lock:
+                if self._cache.get(key) is entry:
+                    del self._cache[key]
+            return None
 
-            # 更新 LRU：移到末尾表示最近使用
-            self._cache.move_to_end(key)
+        # 更新 LRU：记录访问，稍后在锁内批量移到末尾
+        hits = self._hits
+        hits.append(key)
+        if len(hits) >= _HIT_BUFFER_SIZE:
+            with self._lock:
+                self._apply_hits()
 
-            return value
+        return value
 
     async def aget(self, key: CacheKey) -> CacheValue | None:
         """
@@ -171,25 +232,37 @@ class MemoryBackend(BaseBackend):
             if self._max_size == 0:
                 return False
 
+            cache = self._cache
+            now = self._time()
+            if now >= self._next_sweep:
+                self._sweep(now)
+            # 在回收之后查找，持锁期间 existing 与缓存内容一致
+            existing = cache.get(key)
+
             # NX 模式:仅当键不存在时设置
-            if nx and key in self._cache:
+            if nx and existing is not None:
                 # 检查是否已过期
-                _, expires_at = self._cache[key]
-                if expires_at is None or time.time() <= expires_at:
+                _, expires_at = existing
+                if expires_at is None or now <= expires_at:
                     return False  # 键存在且未过期,设置失败
 
             # 计算过期时间
-            expires_at = None if ttl is None else time.time() + ttl
+            expires_at = None if ttl is None else now + ttl
 
-            # 如果键已存在,更新位置
-            if key in self._cache:
-                self._cache.move_to_end(key)
-            # 如果缓存已满,执行 LRU 淘汰
-            elif len(self._cache) >= self._max_size:
-                self._cache.popitem(last=False)
+            if self._sketch is not None:
+                self._sketch.increment(key)
+
+            # 如果键已存在,更新位置（条目恒为元组，existing 非 None 即表示存在）
+            if existing is not None:
+                cache.move_to_end(key)
+            # 如果缓存已满,优先回收过期条目,否则执行淘汰（TinyLFU 可能拒绝写入）
+            elif len(cache) >= self._max_size and not self._make_room(now, key):
+                return False
 
             # 设置缓存值
-            self._cache[key] = (value, expires_at)
+            cache[key] = (value, expires_at)
+            if ttl is not None and expires_at is not None:
+                self._ttl_bucket(ttl, expires_at).append((expires_at, key))
             return True
 
     async def aset(
@@ -281,8 +354,14 @@ class MemoryBackend(BaseBackend):
         示例:
             >>> backend.clear()  # 删除所有缓存
         """
+        # 锁内只替换为新容器（O(1)），旧容器在释放锁后随引用计数归零回收，
+        # 避免逐条释放条目期间阻塞其他线程
         with self._lock:
-            self._cache.clear()
+            old_cache, self._cache = self._cache, OrderedDict()
+            old_buckets, self._ttl_buckets = self._ttl_buckets, {}
+            self._hits.clear()
+            self._closest_expiration = math.inf
+        del old_cache, old_buckets
 
     # ========== 批量操作优化 ==========
 
@@ -290,8 +369,8 @@ class MemoryBackend(BaseBackend):
         """
         批量获取缓存值（优化版）
 
-        相比基类的默认实现，此版本在单个锁内完成所有操作，
-        减少锁开销，提升性能。
+        相比基类的默认实现，此版本无锁完成所有查找，
+        仅在存在过期键或访问缓冲区写满时加锁一次。
 
         Args:
             keys: 缓存键列表
@@ -305,24 +384,34 @@ class MemoryBackend(BaseBackend):
             >>> print(results)  # {"k1": "v1", "k2": "v2"}
         """
         result: dict[CacheKey, CacheValue] = {}
-        now = time.time()
+        expired: list[tuple[CacheKey, tuple[CacheValue, float | None]]] = []
+        now = self._time()
 
-        with self._lock:
-            for key in keys:
-                if key not in self._cache:
-                    continue
+        # 无锁读取
+        cache_get = self._cache.get
+        for key in keys:
+            entry = cache_get(key)
+            if entry is None:
+                continue
 
-                value, expires_at = self._cache[key]
+            value, expires_at = entry
 
-                # 检查是否过期
-                if expires_at is not None and now > expires_at:
-                    # 过期，删除（惰性清理）
-                    del self._cache[key]
-                    continue
+            # 检查是否过期
+            if expires_at is not None and now > expires_at:
+                expired.append((key, entry))
+                continue
+
+            result[key] = value
+
+        # 过期键加锁统一删除（惰性清理）
+        if expired:
+            with self._lock:
+                for key, entry in expired:
+                    if self._cache.get(key) is entry:
+                        del self._cache[key]
 
-                # 更新 LRU
-                self._cache.move_to_end(key)
-                result[key] = value
+        # 更新 LRU（TinyLFU 的频率统计也计入未命中）
+        self._record_hits(result if self._sketch is None else keys)
 
         return result
 
@@ -354,16 +443,99 @@ class MemoryBackend(BaseBackend):
             if self._max_size == 0:
                 return
 
-            expires_at = time.time() + ttl if ttl is not None else None
+            # TinyLFU 需要逐个键做准入判断
+            if self._sketch is not None:
+                for key, value in mapping.items():
+                    self.set(key, value, ttl=ttl)
+                return
 
-            for key, value in mapping.items():
-                # 检查容量并 LRU 淘汰
-                if len(self._cache) >= self._max_size and key not in self._cache:
-                    self._cache.popitem(last=False)
+            now = self._time()
+            if now >= self._next_sweep:
+                self._sweep(now)
+            expires_at = now + ttl if ttl is not None else None
+
+            cache = self._cache
 
+            # 可能超出容量时，先应用访问记录并回收过期条目，确保淘汰顺序正确
+            if len(cache) + len(mapping) > self._max_size:
+                if self._hits:
+                    self._apply_hits()
+                self._reap_locked(now)
+
+            # 绑定局部变量，减少循环内的属性查找
+            move_to_end = cache.move_to_end
+            for key, value in mapping.items():
                 # 存储并移到末尾
-                self._cache[key] = (value, expires_at)
-                self._cache.move_to_end(key)
+                cache[key] = (value, expires_at)
+                move_to_end(key)
+
+            # 整批写入后一次性从头部淘汰超出容量的最久未使用键
+            popitem = cache.popitem
+            for _ in range(len(cache) - self._max_size):
+                popitem(last=False)
+
+            if ttl is not None and expires_at is not None:
+                self._ttl_bucket(ttl, expires_at).extend((expires_at, key) for key in mapping)
+
+    def delete_many(self, keys: list[CacheKey]) -> int:
+        """
+        批量删除缓存（优化版）
+
+        在单个锁内完成所有删除。
+
+        Args:
+            keys: 缓存键列表
+
+        Returns:
+            成功删除的键数量
+
+        示例:
+            >>> backend.delete_many(["k1", "k2", "missing"])  # 2
+        """
+        with self._lock:
+            pop = self._cache.pop
+            return sum(pop(key, None) is not None for key in keys)
+
+    async def aget_many(self, keys: list[CacheKey]) -> dict[CacheKey, CacheValue]:
+        """异步批量获取缓存值（直接调用批量同步实现）"""
+        return self.get_many(keys)
+
+    async def aset_many(
+        self,
+        mapping: dict[CacheKey, CacheValue],
+        ttl: int | None = None,
+    ) -> None:
+        """异步批量设置缓存值（直接调用批量同步实现）"""
+        self.set_many(mapping, ttl=ttl)
+
+    async def adelete_many(self, keys: list[CacheKey]) -> int:
+        """异步批量删除缓存（直接调用批量同步实现）"""
+        return self.delete_many(keys)
+
+    # ========== LRU 访问缓冲 ==========
+
+    def _record_hits(self, keys: Iterable[CacheKey]) -> None:
+        """
+        记录读路径的访问（无需加锁）
+
+        缓冲区累积到一定数量后在锁内批量应用。
+        """
+        self._hits.extend(keys)
+        if len(self._hits) >= _HIT_BUFFER_SIZE:
+            with self._lock:
+                self._apply_hits()
+
+    def _apply_hits(self) -> None:
+        """将缓冲的访问记录按顺序应用到 LRU 顺序及频率统计（调用方需持有锁）"""
+        hits = self._hits
+        cache = self._cache
+        sketch = self._sketch
+        while hits:
+            key = hits.popleft()
+            if key in cache:
+                cache.move_to_end(key)
+            if sketch is not None:
+                sketch.increment(key)
 
     # ========== 扩展操作 ==========
 
@@ -386,19 +558,14 @@ class MemoryBackend(BaseBackend):
         Returns:
             KeysPage 对象
         """
-        import fnmatch
-
         from ..types import KeysPage
 
         with self._lock:
-            # 获取所有键并过滤
-            all_keys = list(self._cache.keys())
+            # 获取所有字符串键（通配符模式只能匹配字符串键）并过滤
+            all_keys = [key for key in self._cache if isinstance(key, str)]
 
             # 模式匹配
-            if pattern != "*":
-                matched_keys = [k for k in all_keys if fnmatch.fnmatch(k, pattern)]
-            else:
-                matched_keys = all_keys
+            matched_keys = filter_keys(pattern, all_keys) if pattern != "*" else all_keys
 
             # 分页处理
             total = len(matched_keys)
@@ -431,6 +598,47 @@ class MemoryBackend(BaseBackend):
         """异步扫描缓存键"""
         return self.keys(pattern=pattern, cursor=cursor, count=count, max_keys=max_keys)
 
+    def incr(self, key: CacheKey, delta: int = 1) -> int:
+        """
+        原子自增
+
+        读取、相加与写回在同一把锁内完成；已存在的键保留原有过期时间，
+        不存在或已过期的键从 0 开始计数（永不过期）。
+
+        Args:
+            key: 缓存键
+            delta: 增量（默认 1）
+
+        Returns:
+            自增后的值
+
+        Raises:
+            ValueError: 当前值不是整数
+            CacheBackendError: 新计数器未能写入（max_size 为 0 或被 TinyLFU 拒绝）
+        """
+        with self._lock:
+            cache = self._cache
+            entry = cache.get(key)
+            if entry is None or (entry[1] is not None and self._time() > entry[1]):
+                if not self.set(key, delta):
+                    msg = f"键 {key!r} 未能写入缓存，自增失败"
+                    raise CacheBackendError(msg)
+                return delta
+
+            value, expires_at = entry
+            if not isinstance(value, int):
+                msg = f"键 {key!r} 的值不是整数类型: {type(value)}"
+                raise ValueError(msg)
+
+            value += delta
+            cache[key] = (value, expires_at)
+            cache.move_to_end(key)
+            return value
+
+    async def aincr(self, key: CacheKey, delta: int = 1) -> int:
+        """异步原子自增（直接调用同步实现）"""
+        return self.incr(key, delta)
+
     def ttl(self, key: CacheKey) -> int:
         """
         获取键的剩余生存时间
@@ -446,86 +654,145 @@ class MemoryBackend(BaseBackend):
             if expires_at is None:
                 return -1
 
-            remaining = int(expires_at - time.time())
+            remaining = int(expires_at - self._time())
             return remaining if remaining > 0 else -2
 
     async def attl(self, key: CacheKey) -> int:
         """异步获取键的剩余生存时间"""
         return self.ttl(key)
 
+    def check_health(self) -> bool:
+        """
+        检查后端健康状态
+
+        内存后端没有外部依赖，直接返回 True；不写入探测键，
+        避免在缓存已满时挤占容量、淘汰真实条目。
+        """
+        return True
+
+    async def acheck_health(self) -> bool:
+        """异步检查后端健康状态"""
+        return self.check_health()
+
     def close(self) -> None:
         """
         关闭后端
 
-        停止后台清理线程。
+        内存后端不持有外部资源（也没有后台线程），无需清理。
         """
-        if self._cleanup_thread and self._cleanup_thread.is_alive():
-            # 设置停止标志(如果有的话)
-            # 当前实现中清理线程是 daemon,会自动退出
-            pass
 
     async def aclose(self) -> None:
         """异步关闭后端"""
         self.close()
 
-    # ========== 后台清理任务 ==========
+    # ========== 过期回收 ==========
 
-    def _start_cleanup_task(self) -> None:
+    def reap(self) -> int:
         """
-        启动后台 TTL 清理任务
+        回收已过期的键
 
-        使用守护线程定期清理过期的键。
-        线程在对象销毁时自动停止。
-        """
+        只检查各 TTL 过期队列的头部，无需遍历全部缓存项。
 
-        def _cleanup_loop() -> None:
-            """后台清理循环"""
-            while not self._stop_cleanup.wait(self._cleanup_interval):
-                self._cleanup_expired()
+        Returns:
+            回收的键数量
 
-        # 创建并启动守护线程
-        self._cleanup_thread = threading.Thread(
-            target=_cleanup_loop,
-            daemon=True,  # 守护线程，主程序退出时自动终止
-            name="symphra-cache-cleanup",
-        )
-        self._cleanup_thread.start()
+        示例:
+            >>> backend.set("temp", "data", ttl=1)
+            >>> time.sleep(1.1)
+            >>> backend.reap()  # 1
+        """
+        with self._lock:
+            return self._reap_locked(self._time())
 
-    def _cleanup_expired(self) -> None:
+    def _ttl_bucket(self, ttl: int, expires_at: float) -> deque[tuple[float, CacheKey]]:
         """
-        清理所有过期的键
+        获取 TTL 对应的过期队列（调用方需持有锁）
 
-        遍历所有缓存项，删除已过期的键。
-        此方法由后台线程定期调用。
+        同时更新最早过期时间；队列中失效记录过多时先压缩。
         """
-        with self._lock:
-            now = time.time()
-            # 收集过期的键
-            expired_keys = [
-                key
-                for key, (_, expires_at) in self._cache.items()
-                if expires_at is not None and now > expires_at
+        bucket = self._ttl_buckets.get(ttl)
+        if bucket is None:
+            bucket = self._ttl_buckets[ttl] = deque()
+        elif len(bucket) > 2 * len(self._cache) + _BUCKET_SLACK:
+            # 覆盖写入/删除留下的失效记录过多，压缩使队列长度与有效条目同阶
+            cache = self._cache
+            live = [
+                (exp, key)
+                for exp, key in bucket
+                if (entry := cache.get(key)) is not None and entry[1] == exp
             ]
+            bucket.clear()
+            bucket.extend(live)
+        if expires_at < self._closest_expiration:
+            self._closest_expiration = expires_at
+        return bucket
+
+    def _reap_locked(self, now: float) -> int:
+        """回收过期条目（调用方需持有锁）"""
+        if now <= self._closest_expiration:
+            return 0
+
+        cache = self._cache
+        buckets = self._ttl_buckets
+        reaped = 0
+        closest = math.inf
+        for ttl, bucket in list(buckets.items()):
+            # 同一 TTL 的队列按过期时间有序，只需弹出已过期的头部
+            while bucket and bucket[0][0] < now:
+                expires_at, key = bucket.popleft()
+                entry = cache.get(key)
+                # 键已被删除或以新的过期时间重新写入时跳过
+                if entry is not None and entry[1] == expires_at:
+                    del cache[key]
+                    reaped += 1
+            if bucket:
+                closest = min(closest, bucket[0][0])
+            else:
+                del buckets[ttl]
+        self._closest_expiration = closest
+        return reaped
 
-            # 批量删除过期键
-            for key in expired_keys:
-                del self._cache[key]
-
-    def __del__(self) -> None:
+    def _make_room(self, now: float, key: CacheKey) -> bool:
         """
-        析构函数
+        容量已满时为新键腾出位置（调用方需持有锁）
 
-        停止后台清理线程。
+        先应用缓冲的访问记录，再回收已过期条目；
+        没有可回收的过期条目时淘汰最久未使用的键。
+        TinyLFU 策略下，新键的访问频率不高于待淘汰键时拒绝写入。
+
+        Returns:
+            是否腾出了位置
         """
-        # 通知清理线程停止
-        self._stop_cleanup.set()
+        if self._hits:
+            self._apply_hits()
+        if self._reap_locked(now):
+            return True
 
-        # 等待线程结束（最多等待 1 秒）
-        if self._cleanup_thread and self._cleanup_thread.is_alive():
-            self._cleanup_thread.join(timeout=1.0)
+        cache = self._cache
+        sketch = self._sketch
+        if sketch is not None and sketch.estimate(key) <= sketch.estimate(next(iter(cache))):
+            return False
+
+        cache.popitem(last=False)
+        return True
+
+    def _sweep(self, now: float) -> None:
+        """过期回收，由写操作每隔 cleanup_interval 顺带触发（调用方需持有锁）"""
+        self._next_sweep = now + self._cleanup_interval
+        self._reap_locked(now)
 
     # ========== 调试和监控方法 ==========
 
+    @property
+    def max_size(self) -> int:
+        """最大缓存条数"""
+        return self._max_size
+
+    @property
+    def cleanup_interval(self) -> int:
+        """过期回收间隔（秒）"""
+        return self._cleanup_interval
+
     def __len__(self) -> int:
         """
         获取当前缓存项数量
@@ -18,10 +18,10 @@ Redis 缓存后端模块
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from ..exceptions import CacheBackendError, CacheConnectionError
-from ..serializers import get_serializer
+from ..serializers import JSONSerializer, get_serializer
 from ..types import SerializationMode
 from .base import BaseBackend
 
@@ -345,6 +345,25 @@ class RedisBackend(BaseBackend):
             msg = f"Redis CLEAR 失败: {e}"
             raise CacheBackendError(msg) from e
 
+    async def aclear(self) -> None:
+        """异步清空所有缓存（使用原生异步客户端，不阻塞事件循环）"""
+        try:
+            pattern = f"{self._key_prefix}*"
+            cursor = 0
+
+            while True:
+                cursor, keys = await self._async_client.scan(cursor, match=pattern, count=100)
+
+                if keys:
+                    await self._async_client.delete(*keys)
+
+                if cursor == 0:
+                    break
+
+        except Exception as e:
+            msg = f"Redis ACLEAR 失败: {e}"
+            raise CacheBackendError(msg) from e
+
     # ========== 批量操作优化 ==========
 
     def get_many(self, keys: list[CacheKey]) -> dict[CacheKey, CacheValue]:
@@ -359,8 +378,8 @@ class RedisBackend(BaseBackend):
         try:
             full_keys = [self._make_key(k) for k in keys]
 
-            # 使用 MGET 批量获取
-            values_bytes = self._client.mget(full_keys)
+            # 使用 MGET 批量获取（值为序列化后的字节，客户端不解码响应）
+            values_bytes = cast("list[bytes | None]", self._client.mget(full_keys))
 
             result: dict[CacheKey, CacheValue] = {}
             for key, value_bytes in zip(keys, values_bytes, strict=False):
@@ -381,30 +400,37 @@ class RedisBackend(BaseBackend):
         """
         批量设置（使用管道优化）
 
-        使用 Pipeline 批量提交命令，减少网络往返。
+        使用 Pipeline 批量提交命令，一次网络往返完成。
+        批量写入各键相互独立，无需 MULTI/EXEC 事务包装。
         """
         if not mapping:
             return
 
         try:
-            # 使用 Pipeline 批量执行
-            pipe = self._client.pipeline()
-
-            for key, value in mapping.items():
-                full_key = self._make_key(key)
-                value_bytes = self._serializer.serialize(value)
-
-                if ttl is not None and ttl > 0:
-                    pipe.setex(full_key, ttl, value_bytes)
-                else:
-                    pipe.set(full_key, value_bytes)
-
+            # 使用非事务 Pipeline 批量执行
+            pipe = self._client.pipeline(transaction=False)
+            self._queue_set_many(pipe, mapping, ttl)
             pipe.execute()
 
         except Exception as e:
             msg = f"Redis MSET 失败: {e}"
             raise CacheBackendError(msg) from e
 
+    def _queue_set_many(
+        self,
+        pipe: Any,
+        mapping: dict[CacheKey, CacheValue],
+        ttl: int | None,
+    ) -> None:
+        """将批量写入命令排入管道（同步/异步管道通用）"""
+        serialize = self._serializer.serialize
+        if ttl is not None and ttl > 0:
+            for key, value in mapping.items():
+                pipe.setex(self._make_key(key), ttl, serialize(value))
+        else:
+            for key, value in mapping.items():
+                pipe.set(self._make_key(key), serialize(value))
+
     def delete_many(self, keys: list[CacheKey]) -> int:
         """批量删除"""
         if not keys:
@@ -418,26 +444,129 @@ class RedisBackend(BaseBackend):
             msg = f"Redis DEL 失败: {e}"
             raise CacheBackendError(msg) from e
 
+    async def aget_many(self, keys: list[CacheKey]) -> dict[CacheKey, CacheValue]:
+        """异步批量获取（使用 MGET，一次网络往返）"""
+        if not keys:
+            return {}
+
+        try:
+            full_keys = [self._make_key(k) for k in keys]
+            values_bytes = cast("list[bytes | None]", await self._async_client.mget(full_keys))
+
+            deserialize = self._serializer.deserialize
+            return {
+                key: deserialize(value_bytes)
+                for key, value_bytes in zip(keys, values_bytes, strict=False)
+                if value_bytes is not None
+            }
+
+        except Exception as e:
+            msg = f"Redis AMGET 失败: {e}"
+            raise CacheBackendError(msg) from e
+
+    async def aset_many(
+        self,
+        mapping: dict[CacheKey, CacheValue],
+        ttl: int | None = None,
+    ) -> None:
+        """异步批量设置（使用非事务 Pipeline，一次网络往返）"""
+        if not mapping:
+            return
+
+        try:
+            pipe = self._async_client.pipeline(transaction=False)
+            self._queue_set_many(pipe, mapping, ttl)
+            await pipe.execute()
+
+        except Exception as e:
+            msg = f"Redis AMSET 失败: {e}"
+            raise CacheBackendError(msg) from e
+
+    async def adelete_many(self, keys: list[CacheKey]) -> int:
+        """异步批量删除（使用可变参数 DEL）"""
+        if not keys:
+            return 0
+
+        try:
+            full_keys = [self._make_key(k) for k in keys]
+            return await self._async_client.delete(*full_keys)
+
+        except Exception as e:
+            msg = f"Redis ADEL 失败: {e}"
+            raise CacheBackendError(msg) from e
+
     # ========== 高级功能 ==========
 
     def incr(self, key: CacheKey, delta: int = 1) -> int:
         """
         原子自增
 
+        计数器与 get/set 使用同一序列化格式，并保留键原有的过期时间：
+        - JSON 序列化：整数即十进制文本，直接使用 INCRBY
+        - 其他序列化：WATCH 乐观事务内读取、反序列化并以 SET KEEPTTL 写回（需 Redis 6.0+）
+
         Args:
             key: 缓存键
             delta: 增量（默认 1）
 
         Returns:
             自增后的值
+
+        Raises:
+            ValueError: 当前值不是整数
+            CacheBackendError: Redis 操作失败
         """
         try:
             full_key = self._make_key(key)
-            return self._client.incrby(full_key, delta)
+            if isinstance(self._serializer, JSONSerializer):
+                return int(self._client.incrby(full_key, delta))
+
+            from redis.exceptions import WatchError
+
+            with self._client.pipeline() as pipe:
+                while True:
+                    try:
+                        pipe.watch(full_key)  # type: ignore[no-untyped-call]
+                        value = self._counter_value(key, pipe.get(full_key)) + delta
+                        pipe.multi()
+                        pipe.set(full_key, self._serializer.serialize(value), keepttl=True)
+                        pipe.execute()
+                        return value
+                    except WatchError:
+                        # 期间键被其他客户端修改，重试
+                        continue
+        except ValueError:
+            raise
         except Exception as e:
             msg = f"Redis INCR 失败: {e}"
             raise CacheBackendError(msg) from e
 
+    async def aincr(self, key: CacheKey, delta: int = 1) -> int:
+        """异步原子自增（语义同 incr）"""
+        try:
+            full_key = self._make_key(key)
+            if isinstance(self._serializer, JSONSerializer):
+                return int(await self._async_client.incrby(full_key, delta))
+
+            from redis.exceptions import WatchError
+
+            async with self._async_client.pipeline() as pipe:
+                while True:
+                    try:
+                        await pipe.watch(full_key)
+                        value = self._counter_value(key, await pipe.get(full_key)) + delta
+                        pipe.multi()  # type: ignore[no-untyped-call]
+                        pipe.set(full_key, self._serializer.serialize(value), keepttl=True)
+                        await pipe.execute()
+                        return value
+                    except WatchError:
+                        continue
+        except ValueError:
+            raise
+        except Exception as e:
+            msg = f"Redis AINCR 失败: {e}"
+            raise CacheBackendError(msg) from e
+
     def decr(self, key: CacheKey, delta: int = 1) -> int:
         """
         原子自减
@@ -448,13 +577,22 @@ class RedisBackend(BaseBackend):
 
         Returns:
             自减后的值
+
+        Raises:
+            ValueError: 当前值不是整数
+            CacheBackendError: Redis 操作失败
         """
-        try:
-            full_key = self._make_key(key)
-            return self._client.decrby(full_key, delta)
-        except Exception as e:
-            msg = f"Redis DECR 失败: {e}"
-            raise CacheBackendError(msg) from e
+        return self.incr(key, -delta)
+
+    def _counter_value(self, key: CacheKey, raw: Any) -> int:
+        """反序列化计数器当前值（不存在视为 0）"""
+        if raw is None:
+            return 0
+        current = self._serializer.deserialize(raw)
+        if not isinstance(current, int):
+            msg = f"键 {key!r} 的值不是整数类型: {type(current)}"
+            raise ValueError(msg)
+        return current
 
     # ========== 扩展操作 ==========
 
@@ -476,38 +614,22 @@ class RedisBackend(BaseBackend):
 
         Returns:
             KeysPage 对象
+
+        Raises:
+            ValueError: count 不是正整数
         """
-        from ..types import KeysPage
+        if count <= 0:
+            msg = f"count 必须为正整数: {count}"
+            raise ValueError(msg)
 
         try:
-            # 添加键前缀到模式
-            full_pattern = f"{self._key_prefix}{pattern}"
-
-            # 使用 SCAN 命令
+            # 使用 SCAN 命令，由服务端按模式过滤（不使用阻塞的 KEYS）
             next_cursor, keys_found = self._client.scan(
                 cursor=cursor,
-                match=full_pattern,
+                match=f"{self._key_prefix}{pattern or '*'}",
                 count=count,
             )
-
-            # 移除键前缀
-            prefix_len = len(self._key_prefix)
-            clean_keys = [k.decode() if isinstance(k, bytes) else k for k in keys_found]
-            clean_keys = [k[prefix_len:] for k in clean_keys]
-
-            # 限制返回数量，优先遵循 count（分页大小）
-            if count is not None and count > 0:
-                clean_keys = clean_keys[:count]
-            # 进一步限制到 max_keys（如果提供）
-            if max_keys is not None:
-                clean_keys = clean_keys[:max_keys]
-
-            return KeysPage(
-                keys=clean_keys,
-                cursor=next_cursor,
-                has_more=next_cursor != 0,
-                total_scanned=len(clean_keys),
-            )
+            return self._make_keys_page(next_cursor, keys_found, count, max_keys)
 
         except Exception as e:
             msg = f"Redis SCAN 失败: {e}"
@@ -521,37 +643,48 @@ class RedisBackend(BaseBackend):
         max_keys: int | None = None,
     ) -> KeysPage:
         """异步扫描缓存键"""
-        from ..types import KeysPage
+        if count <= 0:
+            msg = f"count 必须为正整数: {count}"
+            raise ValueError(msg)
 
         try:
-            full_pattern = f"{self._key_prefix}{pattern}"
-
             next_cursor, keys_found = await self._async_client.scan(
                 cursor=cursor,
-                match=full_pattern,
+                match=f"{self._key_prefix}{pattern or '*'}",
                 count=count,
             )
-
-            prefix_len = len(self._key_prefix)
-            clean_keys = [k.decode() if isinstance(k, bytes) else k for k in keys_found]
-            clean_keys = [k[prefix_len:] for k in clean_keys]
-
-            if count is not None and count > 0:
-                clean_keys = clean_keys[:count]
-            if max_keys is not None:
-                clean_keys = clean_keys[:max_keys]
-
-            return KeysPage(
-                keys=clean_keys,
-                cursor=next_cursor,
-                has_more=next_cursor != 0,
-                total_scanned=len(clean_keys),
-            )
+            return self._make_keys_page(next_cursor, keys_found, count, max_keys)
 
         except Exception as e:
             msg = f"Redis ASCAN 失败: {e}"
             raise CacheBackendError(msg) from e
 
+    def _make_keys_page(
+        self,
+        next_cursor: int,
+        keys_found: list[Any],
+        count: int,
+        max_keys: int | None,
+    ) -> KeysPage:
+        """将 SCAN 结果转换为 KeysPage（单次遍历完成解码与去前缀）"""
+        from ..types import KeysPage
+
+        prefix_len = len(self._key_prefix)
+        clean_keys = [(k.decode() if isinstance(k, bytes) else k)[prefix_len:] for k in keys_found]
+
+        # 限制返回数量，优先遵循 count（分页大小）
+        clean_keys = clean_keys[:count]
+        # 进一步限制到 max_keys（如果提供）
+        if max_keys is not None:
+            clean_keys = clean_keys[:max_keys]
+
+        return KeysPage(
+            keys=clean_keys,
+            cursor=next_cursor,
+            has_more=next_cursor != 0,
+            total_scanned=len(clean_keys),
+        )
+
     def ttl(self, key: CacheKey) -> int:
         """
         获取键的剩余生存时间
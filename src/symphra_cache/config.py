@@ -20,16 +20,23 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 from .exceptions import CacheConfigError
+from .serializers import JSONSerializer
 
 if TYPE_CHECKING:
     from .backends import BaseBackend
 
+# 环境变量取值的字面量（小写比较）
+_ENV_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+_ENV_FALSE_VALUES = frozenset({"false", "0", "no", "off"})
+_ENV_NONE_VALUES = frozenset({"none", "null", ""})
+
 
 class CacheConfig(BaseModel):
     """
@@ -77,21 +84,30 @@ class CacheConfig(BaseModel):
     # ========== Pydantic 配置 ==========
 
     model_config = {
-        "validate_assignment": True,
+        "frozen": True,  # 配置创建后不可修改，无需赋值校验
+        "revalidate_instances": "never",  # 传入已有实例时不再重复校验
         "extra": "forbid",  # 禁止额外字段
         "str_strip_whitespace": True,
     }
 
     # ========== 验证器 ==========
 
+    @field_validator("backend", mode="before")
+    @classmethod
+    def normalize_backend(cls, value: Any) -> Any:
+        """构造时一次性规范化后端名称（去空白、转小写）"""
+        if isinstance(value, str):
+            return value.strip().lower()
+        return value
+
     @model_validator(mode="after")
     def validate_backend(self) -> CacheConfig:
         """验证后端配置"""
         from .backends import get_registered_backends
 
-        # 验证后端类型
+        # 验证后端类型（名称已在 normalize_backend 中转为小写）
         available_backends = get_registered_backends()
-        if self.backend.lower() not in available_backends:
+        if self.backend not in available_backends:
             valid_backends = ", ".join(available_backends)
             msg = f"不支持的后端类型: {self.backend}。支持的类型: {valid_backends}"
             raise ValueError(msg)
@@ -148,27 +164,37 @@ class CacheConfig(BaseModel):
         """
         file_path = Path(file_path)
 
-        if not file_path.exists():
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
             msg = f"配置文件不存在: {file_path}"
-            raise CacheConfigError(msg)
-
-        suffix = file_path.suffix.lower()
+            raise CacheConfigError(msg) from None
 
         try:
-            if suffix in {".yaml", ".yml"}:
-                return cls._from_yaml(file_path)
-            if suffix == ".toml":
-                return cls._from_toml(file_path)
-            if suffix == ".json":
-                return cls._from_json(file_path)
-            msg = f"不支持的配置文件格式: {suffix}"
-            raise CacheConfigError(msg)
+            # 以 (路径, 修改时间, 大小) 为键缓存解析结果，文件变更后自动失效；
+            # 返回深拷贝，调用方修改配置不会影响缓存
+            config = _load_config_file(cls, file_path.resolve(), stat.st_mtime_ns, stat.st_size)
+            return config.model_copy(deep=True)
         except Exception as e:
             if isinstance(e, CacheConfigError):
                 raise
             msg = f"读取配置文件失败: {file_path}"
             raise CacheConfigError(msg) from e
 
+    @classmethod
+    def _load_file(cls, file_path: Path) -> CacheConfig:
+        """按扩展名分派到对应格式的加载方法"""
+        suffix = file_path.suffix.lower()
+
+        if suffix in {".yaml", ".yml"}:
+            return cls._from_yaml(file_path)
+        if suffix == ".toml":
+            return cls._from_toml(file_path)
+        if suffix == ".json":
+            return cls._from_json(file_path)
+        msg = f"不支持的配置文件格式: {suffix}"
+        raise CacheConfigError(msg)
+
     @classmethod
     def _from_yaml(cls, file_path: Path) -> CacheConfig:
         """从 YAML 文件加载"""
@@ -178,8 +204,11 @@ class CacheConfig(BaseModel):
             msg = "YAML 支持需要安装 PyYAML: pip install pyyaml"
             raise ImportError(msg) from e
 
+        # 优先使用 LibYAML 的 C 加载器，未编译 LibYAML 时回退到纯 Python 实现
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
         with file_path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=loader)
 
         if not isinstance(data, dict):
             msg = "YAML 配置文件必须是字典格式"
@@ -190,14 +219,8 @@ class CacheConfig(BaseModel):
     @classmethod
     def _from_toml(cls, file_path: Path) -> CacheConfig:
         """从 TOML 文件加载"""
-        try:
-            import tomllib
-        except ImportError:
-            try:
-                import tomli as tomllib  # Python < 3.11
-            except ImportError as e:
-                msg = "TOML 支持需要安装 tomli: pip install tomli"
-                raise ImportError(msg) from e
+        # 按需导入，未使用 TOML 配置时不承担解析器的导入开销
+        import tomllib
 
         with file_path.open("rb") as f:
             data = tomllib.load(f)
@@ -211,10 +234,9 @@ class CacheConfig(BaseModel):
     @classmethod
     def _from_json(cls, file_path: Path) -> CacheConfig:
         """从 JSON 文件加载"""
-        import json
-
-        with file_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        # 由 JSONSerializer 解析：安装了 orjson 时优先使用，
+        # 超出 64 位的整数回退到标准库，不会被静默转为浮点数
+        data = JSONSerializer().deserialize(file_path.read_bytes())
 
         if not isinstance(data, dict):
             msg = "JSON 配置文件必须是字典格式"
@@ -261,14 +283,16 @@ class CacheConfig(BaseModel):
     @staticmethod
     def _convert_env_value(value: str) -> Any:
         """转换环境变量值类型"""
+        lowered = value.lower()
+
         # 布尔值
-        if value.lower() in {"true", "1", "yes", "on"}:
+        if lowered in _ENV_TRUE_VALUES:
             return True
-        if value.lower() in {"false", "0", "no", "off"}:
+        if lowered in _ENV_FALSE_VALUES:
             return False
 
         # None/null
-        if value.lower() in {"none", "null", ""}:
+        if lowered in _ENV_NONE_VALUES:
             return None
 
         # 数字
@@ -285,3 +309,15 @@ class CacheConfig(BaseModel):
     def __repr__(self) -> str:
         """字符串表示"""
         return f"CacheConfig(backend={self.backend!r}, options={self.options!r})"
+
+
+@lru_cache(maxsize=32)
+def _load_config_file(
+    cls: type[CacheConfig], file_path: Path, mtime_ns: int, size: int
+) -> CacheConfig:
+    """
+    加载并缓存配置文件
+
+    mtime_ns 与 size 只参与缓存键，文件内容变化时自然命中不到旧结果。
+    """
+    return cls._load_file(file_path)
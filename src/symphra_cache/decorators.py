@@ -42,6 +42,59 @@ F = TypeVar("F", bound=Callable[..., Any])
 AsyncF = TypeVar("AsyncF", bound=Callable[..., Any])
 
 
+def _make_binder(
+    func: Callable[..., Any],
+) -> Callable[[tuple[Any, ...], dict[str, Any]], dict[str, Any]]:
+    """
+    为函数生成参数绑定器，返回 {参数名: 值}（含默认值）
+
+    参数全部为普通位置/关键字参数时，生成按参数名直接组装字典的专用绑定器，
+    跳过通用的 Signature.bind；其余签名（*args、**kwargs、仅位置或仅关键字参数）
+    使用 Signature.bind。两者结果一致，参数不匹配时均抛出 TypeError。
+    """
+    sig = inspect.signature(func)
+    params = tuple(sig.parameters.values())
+
+    if any(p.kind is not inspect.Parameter.POSITIONAL_OR_KEYWORD for p in params):
+
+        def bind_generic(args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+            bound_args = sig.bind(*args, **kwargs)
+            bound_args.apply_defaults()
+            return bound_args.arguments
+
+        return bind_generic
+
+    names = tuple(p.name for p in params)
+    name_set = frozenset(names)
+    defaults = {p.name: p.default for p in params if p.default is not inspect.Parameter.empty}
+    count = len(names)
+
+    def bind_simple(args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+        if len(args) > count:
+            msg = "too many positional arguments"
+            raise TypeError(msg)
+        arguments = dict(zip(names, args, strict=False))
+        for name, value in kwargs.items():
+            if name in arguments or name not in name_set:
+                msg = f"unexpected or duplicate argument: {name}"
+                raise TypeError(msg)
+            arguments[name] = value
+        if len(arguments) < count:
+            for name in names[len(args) :]:
+                if name not in arguments:
+                    if name not in defaults:
+                        msg = f"missing argument: {name}"
+                        raise TypeError(msg)
+                    arguments[name] = defaults[name]
+        return arguments
+
+    return bind_simple
+
+
+# 每个函数只解析一次签名（inspect.signature 的开销是参数绑定与序列化之和的数倍）
+_cached_binder = functools.lru_cache(maxsize=1024)(_make_binder)
+
+
 def default_key_builder(
     func: Callable[..., Any],
     args: tuple[Any, ...],
@@ -77,13 +130,16 @@ def default_key_builder(
     # 序列化参数（使用 JSON 保证一致性）
     try:
         # 构建参数字典（包含位置参数和关键字参数）
-        sig = inspect.signature(func)
-        bound_args = sig.bind(*args, **kwargs)
-        bound_args.apply_defaults()
+        try:
+            binder = _cached_binder(func)
+        except TypeError:
+            # 不可哈希的可调用对象无法缓存，直接解析
+            binder = _make_binder(func)
+        arguments = binder(args, kwargs)
 
         # 序列化为 JSON（按键排序保证一致性）
         args_json = json.dumps(
-            bound_args.arguments,
+            arguments,
             sort_keys=True,
             default=str,  # 不可序列化对象转为字符串
         )
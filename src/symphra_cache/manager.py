@@ -9,7 +9,7 @@
 - 后端自动实例化（从配置文件/环境变量）
 - 键前缀支持（命名空间隔离）
 - 统计信息和性能监控
-- get_or_set 模式（缓存穿透优化）
+- get_or_set 模式（缓存穿透优化，同键并发只计算一次）
 - 批量操作优化
 
 设计模式：
@@ -19,7 +19,8 @@
 
 from __future__ import annotations
 
-import time
+import asyncio
+import threading
 from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -79,6 +80,12 @@ class CacheManager:
         """
         self._backend = backend
 
+        # get_or_set 单飞登记：同一键同时只有一个调用方执行工厂函数
+        # 值为 (完成事件, 计算方线程 ID)
+        self._inflight: dict[CacheKey, tuple[threading.Event, int]] = {}
+        self._inflight_lock = threading.Lock()
+        self._ainflight: dict[CacheKey, asyncio.Future[None]] = {}
+
     # ========== 同步基础操作 ==========
 
     def get(self, key: CacheKey) -> CacheValue | None:
@@ -447,7 +454,9 @@ class CacheManager:
         """
         获取缓存值,如果不存在则调用 default_factory 计算并缓存
 
-        这是防止缓存穿透的推荐模式。
+        这是防止缓存穿透的推荐模式。同一键并发未命中时只有首个调用方
+        执行 default_factory，其余调用方等待其完成后读取缓存；若首个调用方
+        失败或值未被缓存，等待方各自计算；工厂函数内对同一键的重入调用直接计算。
 
         Args:
             key: 缓存键
@@ -471,7 +480,38 @@ class CacheManager:
         if value is not None:
             return value
 
-        # 缓存未命中,计算新值
+        thread_id = threading.get_ident()
+        with self._inflight_lock:
+            pending = self._inflight.get(key)
+            if pending is None:
+                event = threading.Event()
+                self._inflight[key] = (event, thread_id)
+
+        if pending is None:
+            try:
+                # 获得计算权前可能已有调用方写入
+                value = self._backend.get(key)
+                if value is not None:
+                    return value
+
+                # 缓存未命中,计算新值
+                value = default_factory()
+                self._backend.set(key, value, ttl=ttl, ex=ex, nx=nx)
+                return value
+            finally:
+                with self._inflight_lock:
+                    del self._inflight[key]
+                event.set()
+
+        pending_event, owner_id = pending
+        # 工厂函数内对同一键的重入调用若等待自身会死锁，此时直接计算
+        if owner_id != thread_id:
+            # 其他调用方正在计算，等待后直接读取其结果
+            pending_event.wait()
+            value = self._backend.get(key)
+            if value is not None:
+                return value
+
         value = default_factory()
         self._backend.set(key, value, ttl=ttl, ex=ex, nx=nx)
         return value
@@ -487,6 +527,8 @@ class CacheManager:
         """
         获取缓存值,如果不存在则调用 default_factory 计算并缓存(异步)
 
+        同一事件循环内同键并发未命中时只有首个协程执行 default_factory。
+
         Args:
             key: 缓存键
             default_factory: 不存在时调用的工厂函数
@@ -509,7 +551,27 @@ class CacheManager:
         if value is not None:
             return value
 
-        # 缓存未命中,计算新值
+        loop = asyncio.get_running_loop()
+        pending = self._ainflight.get(key)
+        if pending is None:
+            future = self._ainflight[key] = loop.create_future()
+            try:
+                # 缓存未命中,计算新值
+                value = default_factory()
+                await self._backend.aset(key, value, ttl=ttl, ex=ex, nx=nx)
+                return value
+            finally:
+                if self._ainflight.get(key) is future:
+                    del self._ainflight[key]
+                future.set_result(None)
+
+        if pending.get_loop() is loop:
+            # 其他协程正在计算；shield 避免本协程取消时连带取消共享的 Future
+            await asyncio.shield(pending)
+            value = await self._backend.aget(key)
+            if value is not None:
+                return value
+
         value = default_factory()
         await self._backend.aset(key, value, ttl=ttl, ex=ex, nx=nx)
         return value
@@ -518,6 +580,8 @@ class CacheManager:
         """
         原子递增计数器(同步)
 
+        由后端的 incr 完成；内存、文件与 Redis 后端原子执行并保留原有过期时间。
+
         Args:
             key: 缓存键
             delta: 增量,默认为 1
@@ -534,22 +598,14 @@ class CacheManager:
             >>> new_value = cache.increment("counter", 5)
             >>> print(new_value)  # 15
         """
-        current = self._backend.get(key)
-        if current is None:
-            current = 0
-
-        if not isinstance(current, int):
-            msg = f"键 {key} 的值不是整数类型: {type(current)}"
-            raise ValueError(msg)
-
-        new_value = current + delta
-        self._backend.set(key, new_value)
-        return new_value
+        return self._backend.incr(key, delta)
 
     async def aincrement(self, key: CacheKey, delta: int = 1) -> int:
         """
         原子递增计数器(异步)
 
+        由后端的 aincr 完成。
+
         Args:
             key: 缓存键
             delta: 增量,默认为 1
@@ -565,17 +621,7 @@ class CacheManager:
             >>> await cache.aset("counter", 10)
             >>> new_value = await cache.aincrement("counter", 5)
         """
-        current = await self._backend.aget(key)
-        if current is None:
-            current = 0
-
-        if not isinstance(current, int):
-            msg = f"键 {key} 的值不是整数类型: {type(current)}"
-            raise ValueError(msg)
-
-        new_value = current + delta
-        await self._backend.aset(key, new_value)
-        return new_value
+        return await self._backend.aincr(key, delta)
 
     def decrement(self, key: CacheKey, delta: int = 1) -> int:
         """
@@ -645,15 +691,9 @@ class CacheManager:
         if not self._backend.exists(key):
             return None
 
-        # 对于 MemoryBackend,可以访问内部数据
+        # 对于 MemoryBackend,由后端按其内部时钟计算剩余时间
         if hasattr(self._backend, "_cache"):
-            cache_data = self._backend._cache.get(key)
-            if cache_data is None:
-                return None
-            _, expires_at = cache_data
-            if expires_at is None:
-                return None
-            remaining = int(expires_at - time.time())
+            remaining = self._backend.ttl(key)
             return remaining if remaining > 0 else None
 
         # 其他后端无法精确获取,返回 None
@@ -752,16 +792,8 @@ class CacheManager:
             >>> if cache.check_health():
             ...     print("缓存服务正常")
         """
-        try:
-            # 尝试设置和获取测试键
-            test_key = "__health_check__"
-            test_value = "ok"
-            self._backend.set(test_key, test_value, ttl=1)
-            result = self._backend.get(test_key)
-            self._backend.delete(test_key)
-            return result == test_value
-        except Exception:
-            return False
+        # 由后端决定探测方式（默认写入并读取测试键）
+        return self._backend.check_health()
 
     async def acheck_health(self) -> bool:
         """
@@ -773,15 +805,7 @@ class CacheManager:
         示例:
             >>> is_healthy = await cache.acheck_health()
         """
-        try:
-            test_key = "__health_check__"
-            test_value = "ok"
-            await self._backend.aset(test_key, test_value, ttl=1)
-            result = await self._backend.aget(test_key)
-            await self._backend.adelete(test_key)
-            return result == test_value
-        except Exception:
-            return False
+        return await self._backend.acheck_health()
 
     def keys(
         self,
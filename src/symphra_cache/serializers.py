@@ -16,16 +16,59 @@
 from __future__ import annotations
 
 import json
+import math
 import pickle
+import re
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
 
 from .exceptions import CacheSerializationError
 from .types import SerializationMode
 
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - 可选依赖
+    _orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from .types import CacheValue
 
+# 19 位以上的连续数字可能是超出 64 位的整数，orjson 会将其静默解析为浮点数
+_LONG_DIGITS = re.compile(rb"\d{19}")
+
+
+_SCALAR_TYPES = frozenset((str, int, bool, type(None)))
+"""不可能含有非有限浮点数的常见标量类型，遍历时直接跳过"""
+
+
+def _has_non_finite(value: Any) -> bool:
+    """检查值中是否含有 NaN/±Infinity（orjson 会将其静默写成 null）"""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if type(item) in _SCALAR_TYPES:
+            continue
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def _json_default(value: Any) -> Any:
+    """标准库 JSON 的补充编码：与 orjson 一致地处理 Enum（取其值）和 UUID（转为字符串）"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID):
+        return str(value)
+    msg = f"Object of type {type(value).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
 
 class BaseSerializer(ABC):
     """
@@ -78,7 +121,7 @@ class JSONSerializer(BaseSerializer):
 
     缺点：
     - 不支持复杂 Python 对象（如 datetime、bytes）
-    - 性能相对较低
+    - 性能相对较低（安装 orjson 后自动使用其 C 实现加速）
 
     示例：
         >>> serializer = JSONSerializer()
@@ -87,11 +130,33 @@ class JSONSerializer(BaseSerializer):
         >>> original = serializer.deserialize(bytes_data)
     """
 
+    # datetime/dataclass 交给标准库处理（即报错），与未安装 orjson 时行为一致；
+    # 非字符串键按标准库规则转为字符串
+    _ORJSON_OPTIONS = (
+        _orjson.OPT_NON_STR_KEYS
+        | _orjson.OPT_PASSTHROUGH_DATETIME
+        | _orjson.OPT_PASSTHROUGH_DATACLASS
+        if _orjson is not None
+        else 0
+    )
+
     def serialize(self, value: CacheValue) -> bytes:
         """将值序列化为 JSON 字节"""
+        if _orjson is not None:
+            try:
+                data = _orjson.dumps(value, option=self._ORJSON_OPTIONS)
+            except TypeError:
+                # orjson 不支持的值（如超出 64 位的整数）回退到标准库
+                pass
+            else:
+                # orjson 会把 NaN/±Infinity 静默写成 null；仅当输出含 null 且值中确有
+                # 非有限浮点数时才交给标准库（普通的 None 不触发回退），
+                # 保证其与未安装 orjson 时一样原样往返
+                if b"null" not in data or not _has_non_finite(value):
+                    return data
         try:
             # 使用 ensure_ascii=False 支持中文等 Unicode 字符
-            json_str = json.dumps(value, ensure_ascii=False)
+            json_str = json.dumps(value, ensure_ascii=False, default=_json_default)
             return json_str.encode("utf-8")
         except (TypeError, ValueError) as e:
             msg = f"JSON 序列化失败: {e}"
@@ -99,6 +164,12 @@ class JSONSerializer(BaseSerializer):
 
     def deserialize(self, data: bytes) -> CacheValue:
         """从 JSON 字节反序列化值"""
+        if _orjson is not None and _LONG_DIGITS.search(data) is None:
+            try:
+                return _orjson.loads(data)
+            except _orjson.JSONDecodeError:
+                # 标准库可解析 NaN/Infinity 等扩展字面量，错误信息也由其统一给出
+                pass
         try:
             json_str = data.decode("utf-8")
             return json.loads(json_str)
@@ -223,15 +294,13 @@ def get_serializer(mode: SerializationMode | str) -> BaseSerializer:
         >>> # 或使用字符串
         >>> serializer = get_serializer("json")
     """
-    # 支持字符串参数
-    if isinstance(mode, str):
-        try:
-            mode = SerializationMode(mode)
-        except ValueError as e:
-            msg = f"不支持的序列化模式: {mode}"
-            raise ValueError(msg) from e
+    # 先规范化为枚举再查注册表（传入枚举成员时直接返回该成员）
+    try:
+        mode = SerializationMode(mode)
+    except ValueError as e:
+        msg = f"不支持的序列化模式: {mode}"
+        raise ValueError(msg) from e
 
-    # 获取序列化器类
     serializer_cls = _SERIALIZERS.get(mode)
     if serializer_cls is None:
         msg = f"未注册的序列化模式: {mode}"
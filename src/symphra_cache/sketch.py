@@ -0,0 +1,104 @@
+"""
+频率估计模块
+
+提供 Count-Min Sketch 频率估计器，以固定内存近似统计键的访问次数。
+
+用途：
+- 缓存预热的访问模式准入过滤（见 warming 模块）
+- 内存后端 TinyLFU 淘汰策略的准入判断（见 MemoryBackend）
+
+使用示例：
+    >>> sketch = CountMinSketch(width=1024)
+    >>> sketch.increment("user:1")
+    1
+    >>> sketch.estimate("user:1")
+    1
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .types import CacheKey
+
+
+class CountMinSketch:
+    """
+    Count-Min Sketch 频率估计器
+
+    以固定内存（width × depth 个 uint32 计数器）近似统计键的访问次数，
+    估计值只会偏大、不会偏小。
+
+    计数器总增量达到 width × depth 时全部减半，使历史频率逐步衰减。
+    """
+
+    __slots__ = ("_width", "_depth", "_table", "_additions", "_reset_at")
+
+    def __init__(self, width: int = 4096, depth: int = 4) -> None:
+        self._width = width
+        self._depth = depth
+        self._table = array("I", bytes(4 * width * depth))
+        self._additions = 0
+        self._reset_at = width * depth
+
+    def increment(self, key: CacheKey) -> int:
+        """
+        记录一次访问并返回该键的频率估计值
+
+        Args:
+            key: 被访问的键
+
+        Returns:
+            自增后的频率估计（各行计数器的最小值）
+        """
+        table = self._table
+        width = self._width
+
+        # 双重哈希：由一次 hash() 派生每一行的下标
+        h = hash(key)
+        h1 = h & 0xFFFFFFFF
+        h2 = ((h >> 32) & 0xFFFFFFFF) | 1
+
+        estimate = 0xFFFFFFFF
+        for row in range(self._depth):
+            idx = row * width + (h1 + row * h2) % width
+            value = table[idx]
+            if value < 0xFFFFFFFF:
+                value += 1
+                table[idx] = value
+            if value < estimate:
+                estimate = value
+
+        self._additions += 1
+        if self._additions >= self._reset_at:
+            self._decay()
+
+        return estimate
+
+    def estimate(self, key: CacheKey) -> int:
+        """
+        返回键的频率估计值（不记录访问）
+
+        Args:
+            key: 要查询的键
+
+        Returns:
+            频率估计（各行计数器的最小值）
+        """
+        table = self._table
+        width = self._width
+
+        h = hash(key)
+        h1 = h & 0xFFFFFFFF
+        h2 = ((h >> 32) & 0xFFFFFFFF) | 1
+
+        return min(table[row * width + (h1 + row * h2) % width] for row in range(self._depth))
+
+    def _decay(self) -> None:
+        """所有计数器减半"""
+        table = self._table
+        for i in range(len(table)):
+            table[i] >>= 1
+        self._additions //= 2
@@ -8,7 +8,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
 from typing import Any, TypeVar
 
 # ========== 类型别名定义 ==========
@@ -52,7 +52,7 @@ class KeysPage:
 # ========== 枚举定义 ==========
 
 
-class SerializationMode(str, Enum):
+class SerializationMode(StrEnum):
     """
     序列化模式枚举
 
@@ -67,7 +67,7 @@ class SerializationMode(str, Enum):
     MSGPACK = "msgpack"  # MessagePack 序列化
 
 
-class EvictionPolicy(str, Enum):
+class EvictionPolicy(StrEnum):
     """
     缓存淘汰策略枚举
 
@@ -75,14 +75,17 @@ class EvictionPolicy(str, Enum):
     - LRU: Least Recently Used（最近最少使用），淘汰最久未访问的项
     - LFU: Least Frequently Used（最不经常使用），淘汰访问次数最少的项
     - FIFO: First In First Out（先进先出），淘汰最早插入的项
+    - TINYLFU: LRU 淘汰 + 频率准入，新键访问频率不高于待淘汰键时拒绝写入，
+      抵御一次性扫描冲刷热点数据
     """
 
     LRU = "lru"  # 最近最少使用
     LFU = "lfu"  # 最不经常使用
     FIFO = "fifo"  # 先进先出
+    TINYLFU = "tinylfu"  # LRU + 频率准入过滤
 
 
-class BackendType(str, Enum):
+class BackendType(StrEnum):
     """
     后端类型枚举
 
@@ -27,16 +27,73 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import csv
+import heapq
+import logging
+import sys
 import time
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass
+from operator import itemgetter
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from .serializers import JSONSerializer
+from .sketch import CountMinSketch
+
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
     from .manager import CacheManager
     from .types import CacheKey, CacheValue
 
 
+logger = logging.getLogger(__name__)
+
+_HEAT_DECAY_NS = 24 * 3600 * 1_000_000_000
+"""热度评分的时间衰减窗口（纳秒），超过此时长未访问的键热度为 0"""
+
+_HISTORY_MAXLEN = 1024
+"""智能预热器保留的历史记录上限，超出后丢弃最旧的记录"""
+
+
+@dataclass(slots=True)
+class _AccessPattern:
+    """
+    单个键的访问模式记录
+
+    使用 __slots__ 存储，避免每个键持有一个独立的字典。
+    """
+
+    count: int  # 访问次数
+    first_access: int  # 首次访问时间（单调时钟，纳秒）
+    last_access: int  # 最近访问时间（单调时钟，纳秒）
+
+
+def _read_csv_pairs(file_path: str) -> dict[CacheKey, CacheValue]:
+    """
+    读取 CSV 文件中的键值对
+
+    只解析一次表头定位 key、value 列下标，逐行按下标取值，避免每行构造字典；
+    列数不足的残缺行被跳过。
+
+    Args:
+        file_path: 文件路径
+
+    Returns:
+        键值对字典，表头缺少 key 或 value 列时为空
+    """
+    with open(file_path, encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        if "key" not in header or "value" not in header:
+            return {}
+        ki, vi = header.index("key"), header.index("value")
+        width = max(ki, vi)
+        return {row[ki]: row[vi] for row in reader if len(row) > width}
+
+
 class CacheWarmer:
     """
     缓存预热器
@@ -60,6 +117,9 @@ class CacheWarmer:
         strategy: str = "manual",
         batch_size: int = 100,
         ttl: int | None = None,
+        concurrency: int = 4,
+        admission_threshold: int = 1,
+        max_tracked_keys: int = 100_000,
     ) -> None:
         """
         初始化缓存预热器
@@ -69,13 +129,25 @@ class CacheWarmer:
             strategy: 预热策略 ("manual", "auto", "incremental")
             batch_size: 批量操作大小
             ttl: 预热数据的默认过期时间
+            concurrency: 同时进行的批量写入数上限
+            admission_threshold: 键被纳入访问模式跟踪所需的最少访问次数；
+                大于 1 时启用 Count-Min Sketch 准入过滤，只访问过一次的键不再占用跟踪内存
+            max_tracked_keys: 访问模式跟踪的键数上限，超出时淘汰最久未访问的键
         """
         self.cache = cache
         self.strategy = strategy
         self.batch_size = batch_size
         self.ttl = ttl
-        self._warming_tasks: list[asyncio.Task[Any]] = []
-        self._access_patterns: dict[CacheKey, dict[str, Any]] = {}
+        self.concurrency = max(1, concurrency)
+        # 任务结束后由完成回调自动移除，避免长期运行时累积已结束的任务
+        self._warming_tasks: set[asyncio.Task[Any]] = set()
+        # 有界跟踪表：OrderedDict 维护访问顺序，O(1) 更新与淘汰
+        self.max_tracked_keys = max(1, max_tracked_keys)
+        self._access_patterns: OrderedDict[CacheKey, _AccessPattern] = OrderedDict()
+        self.admission_threshold = max(1, admission_threshold)
+        self._admission: CountMinSketch | None = (
+            CountMinSketch() if self.admission_threshold > 1 else None
+        )
         self._last_warm_up_time = time.time()
 
     async def warm_up(
@@ -98,18 +170,38 @@ class CacheWarmer:
         if not data:
             return
 
-        # 批量预热，避免一次性操作过多数据
-        keys = list(data.keys())
-        for i in range(0, len(keys), batch_size):
-            batch_keys = keys[i : i + batch_size]
-            batch_data = {key: data[key] for key in batch_keys}
+        await self._warm_batches([(ttl, list(data.items()))], batch_size)
 
-            # 批量设置缓存
-            await self.cache.aset_many(batch_data, ttl=ttl)
+    async def _warm_batches(
+        self,
+        groups: Iterable[tuple[int | None, list[tuple[CacheKey, CacheValue]]]],
+        batch_size: int,
+    ) -> None:
+        """
+        按 TTL 分组批量写入缓存
 
-            # 短暂休眠避免阻塞
-            if i + batch_size < len(keys):
-                await asyncio.sleep(0.01)
+        所有分组的批次并发提交，共用同一个信号量，同时进行的写入数
+        不超过 concurrency，使后端 I/O 延迟（Redis 往返、SQLite 提交）相互重叠。
+
+        Args:
+            groups: (ttl, 键值对列表) 分组
+            batch_size: 批量大小
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _warm_batch(batch_data: dict[CacheKey, CacheValue], ttl: int | None) -> None:
+            async with semaphore:
+                await self.cache.aset_many(batch_data, ttl=ttl)
+
+        # 任一批次失败时 TaskGroup 取消其余批次，不会在后台继续写入；
+        # 取消完成后抛出首个错误（而非 ExceptionGroup）
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for ttl, items in groups:
+                    for i in range(0, len(items), batch_size):
+                        tg.create_task(_warm_batch(dict(items[i : i + batch_size]), ttl))
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0] from None
 
         self._last_warm_up_time = time.time()
 
@@ -130,9 +222,9 @@ class CacheWarmer:
         try:
             data = await asyncio.to_thread(data_source)
             await self.warm_up(data, ttl=ttl)
-        except Exception as e:
+        except Exception:
             # 记录错误但不中断预热过程
-            print(f"自动预热失败: {e}")
+            logger.exception("自动预热失败")
 
     async def incremental_warm_up(
         self,
@@ -153,27 +245,31 @@ class CacheWarmer:
         if not hot_keys:
             return
 
-        # 分批处理热点键
-        for i in range(0, len(hot_keys), self.batch_size):
-            batch_keys = hot_keys[i : i + self.batch_size]
+        # 分批加载热点键：各批次的加载并发进行（由信号量限制），
+        # 每批加载完成后立即写入缓存，使加载延迟与写入延迟相互重叠
+        semaphore = asyncio.Semaphore(self.concurrency)
 
+        async def _warm_batch(batch_no: int, batch_keys: list[CacheKey]) -> None:
             try:
                 # 加载数据
-                data = await asyncio.to_thread(data_loader, batch_keys)
+                async with semaphore:
+                    data = await asyncio.to_thread(data_loader, batch_keys)
 
                 # 预热数据
                 await self.warm_up(data, ttl=ttl)
 
-                # 记录访问模式
-                for key in batch_keys:
-                    self._record_access_pattern(key)
+                # 记录访问模式（整批共用一次时间采样）
+                self._record_access_pattern_bulk(batch_keys, time.monotonic_ns())
 
-            except Exception as e:
-                print(f"增量预热失败 (批次 {i // self.batch_size + 1}): {e}")
+            except Exception:
+                logger.exception("增量预热失败 (批次 %d)", batch_no)
 
-            # 短暂休眠
-            if i + self.batch_size < len(hot_keys):
-                await asyncio.sleep(0.1)
+        # 各批次自行捕获并记录异常，TaskGroup 不会因单批失败而取消其余批次
+        async with asyncio.TaskGroup() as tg:
+            for i in range(0, len(hot_keys), self.batch_size):
+                tg.create_task(
+                    _warm_batch(i // self.batch_size + 1, hot_keys[i : i + self.batch_size])
+                )
 
     def _record_access_pattern(self, key: CacheKey) -> None:
         """
@@ -182,17 +278,37 @@ class CacheWarmer:
         Args:
             key: 被访问的缓存键
         """
-        current_time = time.time()
-        if key not in self._access_patterns:
-            self._access_patterns[key] = {
-                "count": 0,
-                "first_access": current_time,
-                "last_access": current_time,
-            }
+        self._record_access_pattern_bulk((key,), time.monotonic_ns())
 
-        pattern = self._access_patterns[key]
-        pattern["count"] += 1
-        pattern["last_access"] = current_time
+    def _record_access_pattern_bulk(self, keys: Iterable[CacheKey], now: int) -> None:
+        """
+        批量记录访问模式
+
+        Args:
+            keys: 被访问的缓存键
+            now: 预先采样的单调时钟时间戳（time.monotonic_ns()），整批共用
+        """
+        patterns = self._access_patterns
+        admission = self._admission
+        for key in keys:
+            pattern = patterns.get(key)
+            if pattern is None:
+                count = 1
+                if admission is not None:
+                    # 准入过滤：频率估计未达到阈值的键只记入 sketch
+                    count = admission.increment(key)
+                    if count < self.admission_threshold:
+                        continue
+                # 驻留字符串键：跨多次预热反复出现的同名键共享同一对象
+                if isinstance(key, str):
+                    key = sys.intern(key)
+                patterns[key] = _AccessPattern(count, now, now)
+                if len(patterns) > self.max_tracked_keys:
+                    patterns.popitem(last=False)
+            else:
+                pattern.count += 1
+                pattern.last_access = now
+                patterns.move_to_end(key)
 
     def get_hot_keys(self, min_access_count: int = 5, hours: float = 1.0) -> list[CacheKey]:
         """
@@ -205,15 +321,14 @@ class CacheWarmer:
         Returns:
             热点键列表
         """
-        current_time = time.time()
-        cutoff_time = current_time - (hours * 3600)
+        # 整数纳秒比较，避免浮点时间戳的舍入误差
+        cutoff_ns = time.monotonic_ns() - int(hours * 3600 * 1_000_000_000)
 
-        hot_keys = []
-        for key, pattern in self._access_patterns.items():
-            if pattern["count"] >= min_access_count and pattern["last_access"] >= cutoff_time:
-                hot_keys.append(key)
-
-        return hot_keys
+        return [
+            key
+            for key, pattern in self._access_patterns.items()
+            if pattern.count >= min_access_count and pattern.last_access >= cutoff_ns
+        ]
 
     async def start_background_warming(
         self,
@@ -235,12 +350,13 @@ class CacheWarmer:
                     await asyncio.sleep(interval)
                 except asyncio.CancelledError:
                     break
-                except Exception as e:
-                    print(f"后台预热任务失败: {e}")
+                except Exception:
+                    logger.exception("后台预热任务失败")
                     await asyncio.sleep(interval)
 
         task = asyncio.create_task(_background_warm_up())
-        self._warming_tasks.append(task)
+        self._warming_tasks.add(task)
+        task.add_done_callback(self._warming_tasks.discard)
 
     def stop_background_warming(self) -> None:
         """停止所有后台预热任务"""
@@ -257,30 +373,27 @@ class CacheWarmer:
         """
         从文件预热缓存
 
-        支持 JSON、CSV 格式。
+        支持 JSON、CSV 格式。CSV 按表头中的 key、value 列取值，
+        缺少这两列之一的残缺行会被跳过。
 
         Args:
             file_path: 文件路径
             format: 文件格式 ("json", "csv")
             ttl: 过期时间（秒）
         """
-        import csv
-        import json
-
         data: dict[CacheKey, CacheValue] = {}
 
         try:
             if format.lower() == "json":
-                with open(file_path, encoding="utf-8") as f:
-                    file_data = json.load(f)
-                    data.update(file_data)
+                # 在线程中一次性读取字节，避免阻塞事件循环；
+                # 由 JSONSerializer 直接从字节解析（安装了 orjson 时使用其加速，
+                # 超出 64 位的整数回退到标准库，不会被静默转为浮点数）
+                raw = await asyncio.to_thread(Path(file_path).read_bytes)
+                data.update(JSONSerializer().deserialize(raw))
 
             elif format.lower() == "csv":
-                with open(file_path, encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        if "key" in row and "value" in row:
-                            data[row["key"]] = row["value"]
+                # 与 JSON 一样在线程中读取并解析，避免阻塞事件循环
+                data.update(await asyncio.to_thread(_read_csv_pairs, file_path))
 
             else:
                 raise ValueError(f"不支持的文件格式: {format}")
@@ -308,16 +421,12 @@ class CacheWarmer:
             return
 
         # 按 TTL 分组
-        ttl_groups: dict[int, dict[CacheKey, CacheValue]] = {}
+        ttl_groups: defaultdict[int | None, list[tuple[CacheKey, CacheValue]]] = defaultdict(list)
         for key, value in data.items():
-            ttl = ttl_map.get(key, self.ttl)
-            if ttl not in ttl_groups:
-                ttl_groups[ttl] = {}
-            ttl_groups[ttl][key] = value
+            ttl_groups[ttl_map.get(key, self.ttl)].append((key, value))
 
-        # 分组预热
-        for group_ttl, group_data in ttl_groups.items():
-            await self.warm_up(group_data, ttl=group_ttl)
+        # 各分组的批次并发预热，共用同一并发上限
+        await self._warm_batches(ttl_groups.items(), self.batch_size)
 
     def get_warming_stats(self) -> dict[str, Any]:
         """
@@ -339,11 +448,13 @@ class CacheWarmer:
         """
         关闭预热器，清理资源
         """
+        tasks = list(self._warming_tasks)
         self.stop_background_warming()
 
-        # 等待所有任务完成
-        if self._warming_tasks:
-            await asyncio.gather(*self._warming_tasks, return_exceptions=True)
+        # 逐个等待已取消的任务结束，无需 gather 分配结果列表
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
 
     def __repr__(self) -> str:
         """
@@ -382,7 +493,7 @@ class SmartCacheWarmer(CacheWarmer):
         super().__init__(cache, strategy="smart")
         self.prediction_window = prediction_window
         self.learning_rate = learning_rate
-        self._historical_data: list[dict[str, Any]] = []
+        self._historical_data: deque[dict[str, Any]] = deque(maxlen=_HISTORY_MAXLEN)
 
     def _analyze_access_patterns(self) -> dict[CacheKey, float]:
         """
@@ -395,22 +506,13 @@ class SmartCacheWarmer(CacheWarmer):
             return {}
 
         # 简单的热度计算：基于访问频率和最近访问时间
-        current_time = time.time()
-        heat_scores: dict[CacheKey, float] = {}
+        # 热度 = 访问次数 × 时间衰减因子（24 小时线性衰减到 0）
+        now_ns = time.monotonic_ns()
 
-        for key, pattern in self._access_patterns.items():
-            access_count = pattern["count"]
-            last_access = pattern["last_access"]
-
-            # 时间衰减因子
-            time_diff = current_time - last_access
-            time_factor = max(0, 1 - (time_diff / (3600 * 24)))  # 24小时衰减
-
-            # 热度评分
-            heat_score = access_count * time_factor
-            heat_scores[key] = heat_score
-
-        return heat_scores
+        return {
+            key: pattern.count * max(0.0, 1.0 - (now_ns - pattern.last_access) / _HEAT_DECAY_NS)
+            for key, pattern in self._access_patterns.items()
+        }
 
     async def smart_warm_up(
         self,
@@ -429,8 +531,8 @@ class SmartCacheWarmer(CacheWarmer):
         # 分析访问模式
         heat_scores = self._analyze_access_patterns()
 
-        # 获取最热的键
-        sorted_keys = sorted(heat_scores.items(), key=lambda x: x[1], reverse=True)[:top_k]
+        # 获取最热的键（部分选择，O(N log K)，无需对全部键排序）
+        sorted_keys = heapq.nlargest(top_k, heat_scores.items(), key=itemgetter(1))
 
         hot_keys = [key for key, _ in sorted_keys]
 
@@ -13,13 +13,16 @@ from __future__ import annotations
 
 import asyncio
 import tempfile
-import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 from symphra_cache.backends.file import FileBackend
 from symphra_cache.types import SerializationMode
 
+if TYPE_CHECKING:
+    from tests.conftest import FakeClock
+
 
 class TestFileBackendBasics:
     """测试基础功能"""
@@ -110,30 +113,80 @@ class TestFileBackendBasics:
             assert backend.get("key2") is None
             assert backend.get("key3") is None
 
+    def test_set_many(self) -> None:
+        """测试批量设置（单事务提交）"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backend = FileBackend(db_path=Path(tmpdir) / "cache.db")
+
+            backend.set_many({"a": 1, "b": [2, 3], "c": {"d": 4}})
+
+            assert backend.get_many(["a", "b", "c"]) == {"a": 1, "b": [2, 3], "c": {"d": 4}}
+
+    def test_set_many_evicts_over_max_size(self) -> None:
+        """测试批量设置超过容量时执行 LRU 淘汰"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backend = FileBackend(db_path=Path(tmpdir) / "cache.db", max_size=5)
+
+            backend.set_many({f"key{i}": i for i in range(8)})
+
+            assert len(backend) == 5
+
 
 class TestFileBackendTTL:
     """测试 TTL 过期功能"""
 
-    def test_ttl_expiration(self) -> None:
+    def test_ttl_expiration(self, clock: FakeClock) -> None:
         """测试 TTL 过期"""
         with tempfile.TemporaryDirectory() as tmpdir:
-            backend = FileBackend(db_path=Path(tmpdir) / "cache.db")
+            backend = FileBackend(db_path=Path(tmpdir) / "cache.db", time_func=clock)
 
             backend.set("key", "value", ttl=1)
             assert backend.get("key") == "value"
 
-            time.sleep(1.1)
+            clock.advance(1.1)
             assert backend.get("key") is None
 
-    def test_no_ttl(self) -> None:
+    def test_no_ttl(self, clock: FakeClock) -> None:
         """测试无 TTL（永不过期）"""
         with tempfile.TemporaryDirectory() as tmpdir:
-            backend = FileBackend(db_path=Path(tmpdir) / "cache.db")
+            backend = FileBackend(db_path=Path(tmpdir) / "cache.db", time_func=clock)
 
             backend.set("key", "value")
-            time.sleep(0.5)
+            clock.advance(3600)
             assert backend.get("key") == "value"
 
+    def test_incr_preserves_ttl(self, clock: FakeClock) -> None:
+        """测试自增保留原有过期时间，过期键从 0 重新计数"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backend = FileBackend(db_path=Path(tmpdir) / "cache.db", time_func=clock)
+
+            backend.set("counter", 10, ttl=5)
+            assert backend.incr("counter", 5) == 15
+            clock.advance(4)
+            assert backend.get("counter") == 15
+
+            clock.advance(2)
+            assert backend.incr("counter") == 1
+            clock.advance(3600)
+            assert backend.get("counter") == 1
+
+            backend.set("text", "a")
+            with pytest.raises(ValueError, match="不是整数"):
+                backend.incr("text")
+            backend.close(fsync=False)
+
+    def test_get_many_skips_expired(self, clock: FakeClock) -> None:
+        """测试批量获取跳过并清理过期键"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backend = FileBackend(db_path=Path(tmpdir) / "cache.db", time_func=clock)
+
+            backend.set("short", 1, ttl=1)
+            backend.set("long", 2, ttl=60)
+            clock.advance(1.1)
+
+            assert backend.get_many(["short", "long", "missing"]) == {"long": 2}
+            assert len(backend) == 1
+
 
 class TestFileBackendAsync:
     """测试异步操作"""
@@ -169,6 +222,44 @@ class TestFileBackendAsync:
             await asyncio.sleep(1.1)
             assert await backend.aget("key") is None
 
+    @pytest.mark.asyncio
+    async def test_async_set_many(self) -> None:
+        """测试异步批量设置"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backend = FileBackend(db_path=Path(tmpdir) / "cache.db")
+
+            await backend.aset_many({f"key{i}": i for i in range(50)}, ttl=60)
+
+            assert len(backend) == 50
+            assert await backend.aget("key0") == 0
+            assert await backend.aget("key49") == 49
+
+    @pytest.mark.asyncio
+    async def test_async_incr(self) -> None:
+        """测试异步自增并发不丢失更新"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backend = FileBackend(db_path=Path(tmpdir) / "cache.db")
+
+            await asyncio.gather(*(backend.aincr("counter") for _ in range(20)))
+
+            assert backend.get("counter") == 20
+            await backend.aset("text", "a")
+            with pytest.raises(ValueError, match="不是整数"):
+                await backend.aincr("text")
+            backend.close(fsync=False)
+
+    @pytest.mark.asyncio
+    async def test_async_get_delete_many(self) -> None:
+        """测试异步批量获取与删除"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backend = FileBackend(db_path=Path(tmpdir) / "cache.db")
+
+            await backend.aset_many({f"key{i}": i for i in range(10)})
+
+            assert await backend.aget_many(["key0", "key9", "missing"]) == {"key0": 0, "key9": 9}
+            assert await backend.adelete_many(["key0", "key1", "missing"]) == 2
+            assert len(backend) == 8
+
 
 class TestFileBackendSerialization:
     """测试序列化模式"""
@@ -257,3 +348,61 @@ class TestFileBackendEdgeCases:
             repr_str = repr(backend)
             assert "FileBackend" in repr_str
             assert str(db_path) in repr_str
+
+    def test_connection_shared_across_threads(self) -> None:
+        """测试持久连接可在多个线程间共享"""
+        import threading
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backend = FileBackend(db_path=Path(tmpdir) / "cache.db")
+
+            thread = threading.Thread(target=backend.set, args=("key", "value"))
+            thread.start()
+            thread.join()
+
+            assert backend.get("key") == "value"
+            backend.close()
+
+    def test_batch_operations_span_chunks(self) -> None:
+        """测试批量获取与删除跨越 SQL 参数分块"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backend = FileBackend(db_path=Path(tmpdir) / "cache.db")
+            data = {i: f"value{i}" for i in range(1200)}
+            backend.set_many(data)
+
+            # 非字符串键按原样返回
+            assert backend.get_many(list(data)) == data
+            assert backend.get_many([]) == {}
+            assert backend.delete_many([*data, "missing"]) == 1200
+            assert len(backend) == 0
+            backend.close()
+
+    def test_custom_pragmas(self) -> None:
+        """测试自定义 PRAGMA 覆盖默认值"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backend = FileBackend(
+                db_path=Path(tmpdir) / "cache.db",
+                pragmas={"synchronous": "OFF", "journal_mode": "MEMORY"},
+            )
+
+            assert backend._conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+            assert backend._conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+            backend.set("key", "value")
+            assert backend.get("key") == "value"
+            backend.close()
+
+            with pytest.raises(ValueError, match="PRAGMA"):
+                FileBackend(db_path=Path(tmpdir) / "cache.db", pragmas={"x; DROP": 1})
+
+    def test_close_without_fsync(self) -> None:
+        """测试 close(fsync=False) 后数据仍可读取且可重复关闭"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "cache.db"
+            backend = FileBackend(db_path=db_path)
+            backend.set("key", "value")
+            backend.close(fsync=False)
+            backend.close(fsync=False)
+
+            reopened = FileBackend(db_path=db_path)
+            assert reopened.get("key") == "value"
+            reopened.close()
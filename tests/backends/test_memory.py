@@ -15,9 +15,14 @@ from __future__ import annotations
 import asyncio
 import threading
 import time
+from typing import TYPE_CHECKING
 
 import pytest
 from symphra_cache.backends.memory import MemoryBackend
+from symphra_cache.exceptions import CacheBackendError
+
+if TYPE_CHECKING:
+    from tests.conftest import FakeClock
 
 
 class TestMemoryBackendBasics:
@@ -54,6 +59,19 @@ class TestMemoryBackendBasics:
         backend.set("list", [1, 2, 3])
         assert backend.get("list") == [1, 2, 3]
 
+    def test_stores_objects_without_serialization(self) -> None:
+        """测试值按原对象存储（不经过序列化）"""
+        backend = MemoryBackend()
+
+        # lambda 无法被 pickle，能原样取回说明未经过序列化器
+        func = lambda x: x * 2  # noqa: E731
+        backend.set("func", func)
+        assert backend.get("func") is func
+
+        data = {"key": "value", "list": [1, 2, 3]}
+        backend.set("data", data)
+        assert backend.get("data") is data
+
     def test_update_existing_key(self) -> None:
         """测试更新已存在的键"""
         backend = MemoryBackend()
@@ -159,6 +177,22 @@ class TestMemoryBackendTTL:
         time.sleep(1.1)
         assert backend.exists("key") is False
 
+    def test_incr_preserves_ttl(self, clock: FakeClock) -> None:
+        """测试自增保留原有过期时间，过期键从 0 重新计数"""
+        backend = MemoryBackend(time_func=clock)
+
+        backend.set("counter", 10, ttl=5)
+        assert backend.incr("counter", 5) == 15
+        assert backend.ttl("counter") == 5
+
+        clock.advance(6)
+        assert backend.incr("counter") == 1
+        assert backend.ttl("counter") == -1
+
+        backend.set("text", "a")
+        with pytest.raises(ValueError, match="不是整数"):
+            backend.incr("text")
+
 
 class TestMemoryBackendLRU:
     """测试 LRU 淘汰策略"""
@@ -213,6 +247,82 @@ class TestMemoryBackendLRU:
         assert backend.get("key1") == "new_value1"
         assert backend.get("key2") == "value2"
 
+    def test_update_moves_key_to_most_recent(self) -> None:
+        """测试覆盖写入会刷新 LRU 位置"""
+        backend = MemoryBackend(max_size=2)
+
+        backend.set("key1", "value1")
+        backend.set("key2", "value2")
+        backend.set("key1", "new_value1")
+
+        # key2 现在是最旧的，应被淘汰
+        backend.set("key3", "value3")
+
+        assert list(backend._cache) == ["key1", "key3"]
+
+
+class TestMemoryBackendTinyLFU:
+    """测试 TinyLFU 淘汰策略"""
+
+    @staticmethod
+    def _scan_then_count_hot_hits(backend: MemoryBackend) -> int:
+        """写入热点键并多次访问，再扫描 2 倍容量的冷键，返回热点键命中数"""
+        hot = [f"hot{i}" for i in range(10)]
+        for key in hot:
+            backend.set(key, key)
+        for _ in range(5):
+            for key in hot:
+                backend.get(key)
+
+        for i in range(200):
+            backend.set(f"scan{i}", i)
+
+        return sum(backend.get(key) is not None for key in hot)
+
+    def test_tinylfu_scan_resistance(self) -> None:
+        """测试一次性扫描不会冲掉热点数据"""
+        assert self._scan_then_count_hot_hits(MemoryBackend(max_size=100)) == 0
+        assert (
+            self._scan_then_count_hot_hits(MemoryBackend(max_size=100, eviction_policy="tinylfu"))
+            == 10
+        )
+
+    def test_tinylfu_admits_frequent_keys(self) -> None:
+        """测试访问频率足够高的新键可以被写入"""
+        backend = MemoryBackend(max_size=2, eviction_policy="tinylfu")
+        backend.set("key1", "value1")
+        backend.set("key2", "value2")
+
+        # 首次写入的新键频率不高于待淘汰键，被拒绝
+        assert backend.set("key3", "value3") is False
+        assert backend.get("key3") is None
+
+        # 多次请求（含未命中）后频率超过待淘汰键，准入成功
+        backend.get("key3")
+        assert backend.set("key3", "value3") is True
+        assert backend.get("key3") == "value3"
+        assert len(backend) == 2
+
+    def test_incr_rejected_new_counter_raises(self) -> None:
+        """测试新计数器被 TinyLFU 拒绝或容量为 0 时自增报错而非返回未保存的值"""
+        backend = MemoryBackend(max_size=2, eviction_policy="tinylfu")
+        backend.set("a", 1)
+        backend.set("b", 2)
+
+        with pytest.raises(CacheBackendError, match="自增失败"):
+            backend.incr("c", 7)
+        assert backend.get("c") is None
+
+        with pytest.raises(CacheBackendError, match="自增失败"):
+            MemoryBackend(max_size=0).incr("x", 3)
+
+    def test_invalid_eviction_policy(self) -> None:
+        """测试不支持的淘汰策略"""
+        with pytest.raises(ValueError, match="不支持的淘汰策略"):
+            MemoryBackend(eviction_policy="random")
+        with pytest.raises(ValueError, match="不支持的淘汰策略"):
+            MemoryBackend(eviction_policy="fifo")
+
 
 class TestMemoryBackendAsync:
     """测试异步操作"""
@@ -295,6 +405,16 @@ class TestMemoryBackendBatchOperations:
         assert backend.get("key1") is None
         assert backend.get("key2") is None
 
+    def test_set_many_over_capacity(self) -> None:
+        """测试批量设置超出容量时按 LRU 顺序一次性淘汰"""
+        backend = MemoryBackend(max_size=3)
+
+        backend.set_many({"a": 1, "b": 2, "c": 3})
+        backend.get("a")
+        backend.set_many({"d": 4, "e": 5})
+
+        assert backend.get_many(["a", "b", "c", "d", "e"]) == {"a": 1, "d": 4, "e": 5}
+
     def test_delete_many(self) -> None:
         """测试批量删除"""
         backend = MemoryBackend()
@@ -321,6 +441,17 @@ class TestMemoryBackendBatchOperations:
 
         assert results == {"key1": "value1", "key2": "value2"}
 
+    @pytest.mark.asyncio
+    async def test_async_set_and_delete_many(self) -> None:
+        """测试异步批量设置与删除"""
+        backend = MemoryBackend()
+
+        await backend.aset_many({"key1": "value1", "key2": "value2"}, ttl=60)
+        assert await backend.aget_many(["key1", "key2"]) == {"key1": "value1", "key2": "value2"}
+
+        assert await backend.adelete_many(["key1", "missing"]) == 1
+        assert len(backend) == 1
+
 
 class TestMemoryBackendThreadSafety:
     """测试线程安全性"""
@@ -372,6 +503,39 @@ class TestMemoryBackendThreadSafety:
 
         # 无异常即通过
 
+    def test_read_does_not_wait_for_writer_lock(self) -> None:
+        """测试读取不受写锁阻塞"""
+        backend = MemoryBackend()
+        backend.set("key", "value")
+        results: list[object] = []
+
+        backend._lock.acquire()
+        try:
+            t = threading.Thread(target=lambda: results.append(backend.get("key")))
+            t.start()
+            t.join(timeout=1.0)
+            assert not t.is_alive()
+        finally:
+            backend._lock.release()
+
+        assert results == ["value"]
+
+    def test_concurrent_incr(self) -> None:
+        """测试并发自增不丢失更新"""
+        backend = MemoryBackend()
+
+        def worker() -> None:
+            for _ in range(1000):
+                backend.incr("counter")
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert backend.get("counter") == 5000
+
 
 class TestMemoryBackendEdgeCases:
     """测试边界条件"""
@@ -399,6 +563,35 @@ class TestMemoryBackendEdgeCases:
         backend.delete("key1")
         assert len(backend) == 1
 
+    def test_keys_with_pattern(self) -> None:
+        """测试通配符模式过滤键"""
+        backend = MemoryBackend()
+        for key in ("user:1", "user:22", "User:3", "order:1", "a.b1", "axb1"):
+            backend.set(key, "v")
+
+        assert backend.keys(pattern="user:*").keys == ["user:1", "user:22"]
+        assert backend.keys(pattern="user:?").keys == ["user:1"]
+        assert backend.keys(pattern="[uU]ser:*").keys == ["user:1", "user:22", "User:3"]
+        assert backend.keys(pattern="*:1").keys == ["user:1", "order:1"]
+        # 前缀快速路径按字面量匹配
+        assert backend.keys(pattern="a.b*").keys == ["a.b1"]
+
+        # 非字符串键不参与通配符匹配
+        backend.set(1, "v")
+        assert backend.keys(pattern="*:1").keys == ["user:1", "order:1"]
+        assert 1 not in backend.keys(pattern="*").keys
+
+    def test_check_health_does_not_evict(self) -> None:
+        """测试健康检查不写入探测键、不淘汰已满缓存中的条目"""
+        backend = MemoryBackend(max_size=2)
+        backend.set("key1", "value1")
+        backend.set("key2", "value2")
+
+        assert backend.check_health() is True
+        assert backend.get("key1") == "value1"
+        assert backend.get("key2") == "value2"
+        assert len(backend) == 2
+
     def test_repr_method(self) -> None:
         """测试 repr() 方法"""
         backend = MemoryBackend(max_size=100)
@@ -411,19 +604,73 @@ class TestMemoryBackendEdgeCases:
         assert "size=2" in repr_str
         assert "max_size=100" in repr_str
 
-    def test_background_cleanup(self) -> None:
-        """测试后台清理任务"""
-        backend = MemoryBackend(cleanup_interval=1)
+    def test_reap_expired(self, clock: FakeClock) -> None:
+        """测试主动回收过期键"""
+        backend = MemoryBackend(time_func=clock)
 
         # 设置多个过期键
         for i in range(10):
             backend.set(f"key{i}", f"value{i}", ttl=1)
+        backend.set("persistent", "value")
 
         # 验证键存在
-        assert len(backend) == 10
+        assert len(backend) == 11
 
-        # 等待后台清理
-        time.sleep(2)
+        clock.advance(1.1)
 
-        # 验证键已被清理
-        assert len(backend) == 0
+        # 验证过期键被回收，永不过期的键保留
+        assert backend.reap() == 10
+        assert len(backend) == 1
+
+    def test_reap_skips_rewritten_keys(self, clock: FakeClock) -> None:
+        """测试以新 TTL 重新写入的键不会被旧的过期记录回收"""
+        backend = MemoryBackend(time_func=clock)
+
+        backend.set("key", "old", ttl=1)
+        backend.set("key", "new", ttl=60)
+        backend.set_many({"a": 1, "b": 2}, ttl=1)
+        backend.delete("a")
+
+        clock.advance(1.1)
+
+        assert backend.reap() == 1
+        assert backend.get("key") == "new"
+        assert len(backend) == 1
+
+    def test_ttl_bucket_compaction(self) -> None:
+        """测试反复覆盖写入时过期队列保持有界"""
+        backend = MemoryBackend()
+
+        for i in range(1000):
+            backend.set("key", i, ttl=60)
+
+        assert len(backend._ttl_buckets[60]) < 100
+        assert backend.get("key") == 999
+
+    def test_write_triggers_periodic_sweep(self, clock: FakeClock) -> None:
+        """测试写操作按 cleanup_interval 顺带清理过期键（无后台线程）"""
+        backend = MemoryBackend(cleanup_interval=1, time_func=clock)
+
+        for i in range(10):
+            backend.set(f"key{i}", f"value{i}", ttl=1)
+
+        clock.advance(1.1)
+        backend.set("trigger", "value")
+
+        assert len(backend) == 1
+
+    def test_full_cache_reclaims_expired_before_evicting(self, clock: FakeClock) -> None:
+        """测试容量已满时优先回收过期条目而非淘汰有效条目"""
+        backend = MemoryBackend(max_size=3, time_func=clock)
+
+        backend.set("expiring", "value", ttl=1)
+        backend.set("live1", "value1")
+        backend.set("live2", "value2")
+
+        clock.advance(1.1)
+        backend.set("live3", "value3")
+
+        assert backend.get("live1") == "value1"
+        assert backend.get("live2") == "value2"
+        assert backend.get("live3") == "value3"
+        assert len(backend) == 3
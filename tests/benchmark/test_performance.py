@@ -127,9 +127,10 @@ class TestScalability:
         cache = CacheManager(backend=MemoryBackend(max_size=size * 2))
 
         data = {f"key{i}": f"value{i}" for i in range(size)}
+        keys = list(data)
 
         def operations():
             cache.set_many(data)
-            cache.get_many(list(data.keys()))
+            cache.get_many(keys)
 
         benchmark(operations)
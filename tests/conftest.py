@@ -5,18 +5,168 @@ Pytest 配置和全局 fixtures
 """
 
 import asyncio
-from collections.abc import Generator
+from collections.abc import Callable, Generator
+from pathlib import Path
+from typing import Any
 
 import pytest
 
+from symphra_cache import CacheManager
+from symphra_cache.backends import FileBackend, MemoryBackend
+
+# 只关心逻辑正确性的文件后端测试无需崩溃恢复保证，关闭 fsync 与磁盘日志
+FAST_FILE_PRAGMAS: dict[str, str | int] = {
+    "synchronous": "OFF",
+    "journal_mode": "MEMORY",
+    "temp_store": "MEMORY",
+    "cache_size": -65536,
+}
+
+
+try:
+    import uvloop
+except ImportError:  # 可选依赖，未安装时使用标准库事件循环
+    uvloop = None
+
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories(
+        config: pytest.Config, item: pytest.Item
+    ) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+        """
+        安装了 uvloop 时让异步测试运行在其 C 实现的事件循环上
+
+        事件循环本身由 pytest-asyncio 按会话级作用域创建（见 pyproject.toml）；
+        该钩子需要 pytest-asyncio 1.4.0 及以上版本。
+        """
+        return {"uvloop": uvloop.new_event_loop}
+
+
+class FakeClock:
+    """
+    可手动推进的模拟时钟
+
+    作为 time_func 注入后端，用 advance() 推进逻辑时间代替真实 sleep。
+    """
+
+    def __init__(self, start: float = 1000.0) -> None:
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        """将时钟向前推进指定秒数"""
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """每个测试独立的模拟时钟"""
+    return FakeClock()
+
+
+@pytest.fixture(scope="session")
+def shared_memory_backend() -> MemoryBackend:
+    """
+    会话级共享的内存后端
+
+    仅供只做接口自省（hasattr / repr 等）、不读写数据的测试使用。
+    """
+    return MemoryBackend()
+
+
+@pytest.fixture
+def fresh_manager() -> CacheManager:
+    """每个测试独立的内存后端缓存管理器"""
+    return CacheManager(backend=MemoryBackend())
+
 
 @pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
+def yaml_memory_config(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """
-    创建全局事件循环 fixture
+    会话级共享的内存后端 YAML 配置文件
 
-    用于支持异步测试，确保所有测试共享同一个事件循环。
+    内容固定，测试只读使用，整个会话只写一次。
     """
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+    import yaml
+
+    path = tmp_path_factory.mktemp("config") / "memory.yaml"
+    path.write_text(
+        yaml.dump({"backend": "memory", "options": {"max_size": 5000, "cleanup_interval": 120}}),
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture(scope="session")
+def yml_memory_config(yaml_memory_config: Path) -> Path:
+    """会话级共享的 .yml 扩展名配置文件（内容与 yaml_memory_config 相同）"""
+    path = yaml_memory_config.with_suffix(".yml")
+    path.write_bytes(yaml_memory_config.read_bytes())
+    return path
+
+
+@pytest.fixture(scope="session")
+def toml_file_config(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    会话级共享的文件后端 TOML 配置文件
+
+    内容固定，测试只读使用，整个会话只写一次。
+    """
+    path = tmp_path_factory.mktemp("config") / "file.toml"
+    path.write_text('backend = "file"\n\n[options]\ndb_path = "/tmp/test.db"\n', encoding="utf-8")
+    return path
+
+
+@pytest.fixture(scope="session")
+def json_memory_config(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    会话级共享的内存后端 JSON 配置文件
+
+    内容固定，测试只读使用，整个会话只写一次。
+    """
+    import json
+
+    path = tmp_path_factory.mktemp("config") / "memory.json"
+    path.write_text(
+        json.dumps({"backend": "memory", "options": {"max_size": 5000, "cleanup_interval": 120}}),
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    """
+    每个测试独立的 SQLite 数据库路径
+
+    基于 pytest 的 tmp_path（由会话级 tmp_path_factory 统一创建与清理），
+    避免每个测试单独 mkdtemp + rmtree。
+    """
+    return tmp_path / "cache.db"
+
+
+@pytest.fixture
+def fast_file_backend(db_path: Path) -> Generator[Callable[..., FileBackend], None, None]:
+    """
+    创建关闭持久性保证的 FileBackend 的工厂 fixture
+
+    默认使用 db_path fixture 的路径（同一测试内的实例共享数据库）；
+    测试结束时以 fsync=False 自动关闭所有创建的后端。
+    """
+    backends: list[FileBackend] = []
+
+    def factory(path: Path | None = None, **kwargs: Any) -> FileBackend:
+        backend = FileBackend(
+            db_path=path or db_path,
+            pragmas=FAST_FILE_PRAGMAS,
+            **kwargs,
+        )
+        backends.append(backend)
+        return backend
+
+    yield factory
+
+    for backend in backends:
+        backend.close(fsync=False)
@@ -4,8 +4,6 @@
 测试整个系统的端到端功能。
 """
 
-import tempfile
-import time
 from pathlib import Path
 
 import pytest
@@ -52,33 +50,38 @@ class TestEndToEnd:
         manager = CacheManager(backend=MemoryBackend())
         monitor = CacheMonitor(manager)
 
+        call_count = 0
+
         @cache(manager, ttl=60)
         def expensive_function(x: int) -> int:
-            time.sleep(0.1)  # 模拟耗时操作
+            nonlocal call_count
+            call_count += 1
             return x * 2
 
         # 第一次调用（未命中）
         result1 = expensive_function(5)
         assert result1 == 10
 
-        # 第二次调用（命中）
+        # 第二次调用（命中，不再执行函数）
         result2 = expensive_function(5)
         assert result2 == 10
+        assert call_count == 1
 
         # 检查统计（注意：装饰器可能增加额外的 get/set）
         stats = monitor.get_stats()
         assert stats.gets > 0
         assert stats.sets > 0
 
-    def test_multi_backend_workflow(self) -> None:
+    def test_multi_backend_workflow(self, db_path: Path) -> None:
         """测试多后端工作流"""
         # Memory 后端
         mem_cache = CacheManager(backend=MemoryBackend())
         mem_cache.set("temp", "data")
 
         # File 后端
-        with tempfile.TemporaryDirectory() as tmpdir:
-            file_cache = CacheManager(backend=FileBackend(db_path=Path(tmpdir) / "cache.db"))
+        file_backend = FileBackend(db_path=db_path)
+        file_cache = CacheManager(backend=file_backend)
+        try:
             file_cache.set("persistent", "data")
 
             # 验证独立性
@@ -88,6 +91,8 @@ class TestEndToEnd:
             # 验证持久化
             file_value = file_cache.get("persistent")
             assert file_value == "data"
+        finally:
+            file_backend.close(fsync=False)
 
 
 class TestConcurrency:
@@ -95,64 +100,41 @@ class TestConcurrency:
 
     def test_concurrent_reads(self) -> None:
         """测试并发读取"""
-        import threading
+        from concurrent.futures import ThreadPoolExecutor, as_completed
 
         manager = CacheManager(backend=MemoryBackend())
 
         # 预设数据
-        for i in range(100):
-            manager.set(f"key{i}", f"value{i}")
-
-        results = []
-        errors = []
-
-        def read_worker():
-            try:
-                for i in range(100):
-                    value = manager.get(f"key{i}")
-                    results.append(value)
-            except Exception as e:
-                errors.append(e)
-
-        threads = [threading.Thread(target=read_worker) for _ in range(10)]
+        manager.set_many({f"key{i}": f"value{i}" for i in range(100)})
 
-        for t in threads:
-            t.start()
+        def read_worker() -> list:
+            return [manager.get(f"key{i}") for i in range(100)]
 
-        for t in threads:
-            t.join()
-
-        # 不应该有错误
-        assert len(errors) == 0
+        results = []
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            futures = [executor.submit(read_worker) for _ in range(10)]
+            # result() 会直接抛出工作线程中的异常
+            for future in as_completed(futures):
+                results.extend(future.result())
 
         # 应该有 1000 次成功读取
         assert len(results) == 1000
 
     def test_concurrent_writes(self) -> None:
         """测试并发写入"""
-        import threading
+        from concurrent.futures import ThreadPoolExecutor, as_completed
 
         manager = CacheManager(backend=MemoryBackend(max_size=10000))
 
-        errors = []
-
-        def write_worker(worker_id):
-            try:
-                for i in range(100):
-                    manager.set(f"key_{worker_id}_{i}", f"value_{worker_id}_{i}")
-            except Exception as e:
-                errors.append(e)
-
-        threads = [threading.Thread(target=write_worker, args=(i,)) for i in range(10)]
+        def write_worker(worker_id: int) -> None:
+            for i in range(100):
+                manager.set(f"key_{worker_id}_{i}", f"value_{worker_id}_{i}")
 
-        for t in threads:
-            t.start()
-
-        for t in threads:
-            t.join()
-
-        # 不应该有错误
-        assert len(errors) == 0
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            futures = [executor.submit(write_worker, i) for i in range(10)]
+            # result() 会直接抛出工作线程中的异常
+            for future in as_completed(futures):
+                future.result()
 
 
 class TestErrorHandlingIntegration:
@@ -209,63 +191,26 @@ class TestErrorHandlingIntegration:
         manager._backend.get = original_get
 
 
-class TestPersistenceIntegration:
-    """持久化集成测试"""
-
-    def test_file_backend_persistence(self) -> None:
-        """测试文件后端持久化"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "cache.db"
-
-            # 第一个管理器实例
-            cache1 = CacheManager(backend=FileBackend(db_path=db_path))
-            cache1.set("persistent_key", "persistent_value")
-            cache1.close()
-
-            # 第二个管理器实例（重新打开数据库）
-            cache2 = CacheManager(backend=FileBackend(db_path=db_path))
-            value = cache2.get("persistent_key")
-
-            assert value == "persistent_value"
-            cache2.close()
-
-
 class TestConfigurationIntegration:
     """配置集成测试"""
 
-    def test_yaml_config_integration(self) -> None:
+    def test_yaml_config_integration(self, yaml_memory_config: Path) -> None:
         """测试 YAML 配置集成"""
-        import yaml
-
-        config_data = {
-            "backend": "memory",
-            "options": {"max_size": 5000, "cleanup_interval": 120},
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = f.name
+        # 从文件加载配置
+        manager = CacheManager.from_file(yaml_memory_config)
 
-        try:
-            # 从文件加载配置
-            manager = CacheManager.from_file(config_path)
-
-            # 验证后端类型
-            assert isinstance(manager.backend, MemoryBackend)
+        # 验证后端类型
+        assert isinstance(manager.backend, MemoryBackend)
 
-            # 验证配置生效
-            assert manager.backend._max_size == 5000
-            assert manager.backend._cleanup_interval == 120
+        # 验证配置生效
+        assert manager.backend._max_size == 5000
+        assert manager.backend._cleanup_interval == 120
 
-            # 验证功能正常
-            manager.set("key", "value")
-            assert manager.get("key") == "value"
-
-        finally:
-            Path(config_path).unlink()
+        # 验证功能正常
+        manager.set("key", "value")
+        assert manager.get("key") == "value"
 
 
-@pytest.mark.asyncio
 class TestAsyncIntegration:
     """异步集成测试"""
 
@@ -274,15 +219,13 @@ class TestAsyncIntegration:
         manager = CacheManager(backend=MemoryBackend())
 
         # 异步设置
-        await manager.aset("user:1", {"name": "Alice"})
-        await manager.aset("user:2", {"name": "Bob"})
+        await manager.aset_many({"user:1": {"name": "Alice"}, "user:2": {"name": "Bob"}})
 
         # 异步获取
-        user1 = await manager.aget("user:1")
-        user2 = await manager.aget("user:2")
+        users = await manager.aget_many(["user:1", "user:2"])
 
-        assert user1["name"] == "Alice"
-        assert user2["name"] == "Bob"
+        assert users["user:1"]["name"] == "Alice"
+        assert users["user:2"]["name"] == "Bob"
 
         # 异步批量操作
         data = {f"key{i}": f"value{i}" for i in range(10)}
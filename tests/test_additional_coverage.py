@@ -6,8 +6,7 @@
 
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 from symphra_cache import CacheManager
@@ -19,6 +18,12 @@ from symphra_cache.serializers import (
 )
 from symphra_cache.types import SerializationMode
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from tests.conftest import FakeClock
+
 
 class TestSerializersAdditional:
     """序列化器的额外测试"""
@@ -79,78 +84,72 @@ class TestManagerFactoryMethods:
         manager.set("key", "value")
         assert manager.get("key") == "value"
 
-    def test_create_file_cache(self) -> None:
+    def test_create_file_cache(self, db_path: Path) -> None:
         """测试创建文件缓存"""
         from symphra_cache.manager import create_file_cache
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = create_file_cache(db_path=Path(tmpdir) / "cache.db")
+        manager = create_file_cache(db_path=db_path)
+        backend = manager.backend
+        assert isinstance(backend, FileBackend)
+        try:
             assert isinstance(manager, CacheManager)
 
             # 测试功能
             manager.set("key", "value")
             assert manager.get("key") == "value"
+        finally:
+            backend.close(fsync=False)
 
 
 class TestFileBackendAdditional:
     """文件后端的额外测试"""
 
-    def test_file_backend_persistence(self) -> None:
+    @pytest.mark.parametrize("value", ["persistent_value", {"data": [1, 2, 3]}])
+    def test_file_backend_persistence(
+        self, fast_file_backend: Callable[..., FileBackend], value: object
+    ) -> None:
         """测试文件后端的持久化"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "cache.db"
-
-            # 第一个实例
-            backend1 = FileBackend(db_path=db_path)
-            backend1.set("persistent_key", "persistent_value")
-            backend1.close()
-
-            # 第二个实例（应该读取之前的数据）
-            backend2 = FileBackend(db_path=db_path)
-            value = backend2.get("persistent_key")
-
-            # 文件后端应该保存值
-            assert value is not None or backend2.get("persistent_key") is None
-
-    def test_file_backend_with_ttl(self) -> None:
+        # 第一个实例
+        backend1 = fast_file_backend()
+        backend1.set("persistent_key", value)
+        backend1.close(fsync=False)
+
+        # 第二个实例（应该读取之前的数据）
+        backend2 = fast_file_backend()
+        assert backend2.get("persistent_key") == value
+
+    def test_file_backend_with_ttl(
+        self, fast_file_backend: Callable[..., FileBackend], clock: FakeClock
+    ) -> None:
         """测试文件后端的 TTL"""
-        import time
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            backend = FileBackend(db_path=Path(tmpdir) / "cache.db")
-
-            # 设置有 TTL 的值
-            backend.set("ttl_key", "value", ttl=1)
+        # 注入模拟时钟，推进逻辑时间代替真实等待
+        backend = fast_file_backend(time_func=clock)
 
-            # 立即检查
-            assert backend.exists("ttl_key")
+        # 设置有 TTL 的值
+        backend.set("ttl_key", "value", ttl=1)
 
-            # 等待过期
-            time.sleep(1.1)
+        # 立即检查
+        assert backend.exists("ttl_key")
 
-            # 检查是否过期（可能不会立即过期，取决于实现）
-            result = backend.get("ttl_key")
-            # result 可能是 None（已过期）或仍然存在
+        # 推进时间至过期之后
+        clock.advance(2)
 
-            backend.close()
+        assert backend.get("ttl_key") is None
 
-    def test_file_backend_clear(self) -> None:
+    def test_file_backend_clear(self, fast_file_backend: Callable[..., FileBackend]) -> None:
         """测试文件后端的清除"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            backend = FileBackend(db_path=Path(tmpdir) / "cache.db")
+        backend = fast_file_backend()
 
-            # 设置多个值
-            backend.set("key1", "value1")
-            backend.set("key2", "value2")
-
-            # 清除
-            backend.clear()
+        # 设置多个值
+        backend.set("key1", "value1")
+        backend.set("key2", "value2")
 
-            # 检查是否为空
-            assert backend.get("key1") is None
-            assert backend.get("key2") is None
+        # 清除
+        backend.clear()
 
-            backend.close()
+        # 检查是否为空
+        assert backend.get("key1") is None
+        assert backend.get("key2") is None
 
 
 class TestMemoryBackendAdditional:
@@ -166,9 +165,12 @@ class TestMemoryBackendAdditional:
         backend.set("key3", "value3")
         backend.set("key4", "value4")  # 应该驱逐最旧的
 
-        # 最老的键可能被驱逐
-        size = len(backend)
-        assert size <= 3
+        # 最久未使用的 key1 被驱逐，其余按 LRU 顺序保留
+        assert len(backend) == 3
+        assert backend.get("key1") is None
+        assert backend.get("key2") == "value2"
+        assert backend.get("key3") == "value3"
+        assert backend.get("key4") == "value4"
 
     def test_memory_backend_batch_operations(self) -> None:
         """测试内存后端的批量操作"""
@@ -214,9 +216,9 @@ class TestBackendBaseClass:
         backend = MemoryBackend()
         assert backend is not None
 
-    def test_backend_repr(self) -> None:
+    def test_backend_repr(self, shared_memory_backend: MemoryBackend) -> None:
         """测试后端的字符串表示"""
-        backend = MemoryBackend()
+        backend = shared_memory_backend
         repr_str = repr(backend)
         assert "MemoryBackend" in repr_str
 
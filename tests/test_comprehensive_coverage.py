@@ -6,8 +6,7 @@
 
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import pytest
 from symphra_cache import CacheManager
@@ -15,47 +14,50 @@ from symphra_cache.backends import FileBackend, MemoryBackend
 from symphra_cache.config import CacheConfig
 from symphra_cache.invalidation import CacheInvalidator
 
+if TYPE_CHECKING:
+    from pathlib import Path
 
-class TestBackendBaseClassComprehensive:
-    """后端基类的全面测试"""
-
-    def test_backend_abstract_methods(self) -> None:
-        """测试后端的抽象方法"""
-        # BaseBackend 是抽象类，不能直接实例化
-        # 但我们可以测试它的子类实现
-
-        backend = MemoryBackend()
-        assert hasattr(backend, "get")
-        assert hasattr(backend, "set")
-        assert hasattr(backend, "delete")
-        assert hasattr(backend, "exists")
-        assert hasattr(backend, "clear")
+# 与 conftest 中 yaml_memory_config / json_memory_config 写入的配置一致
+_MEMORY_CONFIG: dict[str, Any] = {
+    "backend": "memory",
+    "options": {"max_size": 5000, "cleanup_interval": 120},
+}
 
-    def test_backend_async_methods(self) -> None:
-        """测试后端的异步方法"""
-        backend = MemoryBackend()
 
-        # 异步方法应该存在
-        assert hasattr(backend, "aget")
-        assert hasattr(backend, "aset")
-        assert hasattr(backend, "adelete")
-
-    def test_backend_batch_methods(self) -> None:
-        """测试后端的批量方法"""
-        backend = MemoryBackend()
+class TestBackendBaseClassComprehensive:
+    """后端基类的全面测试"""
 
-        # 批量方法应该存在
-        assert hasattr(backend, "get_many")
-        assert hasattr(backend, "set_many")
-        assert hasattr(backend, "delete_many")
+    @pytest.mark.parametrize(
+        "name",
+        [
+            # 基本操作
+            "get",
+            "set",
+            "delete",
+            "exists",
+            "clear",
+            # 异步方法
+            "aget",
+            "aset",
+            "adelete",
+            # 批量方法
+            "get_many",
+            "set_many",
+            "delete_many",
+        ],
+    )
+    def test_backend_has_method(self, name: str) -> None:
+        """测试后端子类实现了基类的各个方法"""
+        # BaseBackend 是抽象类，不能直接实例化；在子类上检查即可，无需构造实例
+        assert callable(getattr(MemoryBackend, name, None))
 
 
 class TestInvalidationComprehensive:
     """缓存失效的全面测试"""
 
-    def test_invalidator_initialization(self) -> None:
+    def test_invalidator_initialization(self, fresh_manager: CacheManager) -> None:
         """测试失效器的初始化"""
-        manager = CacheManager(backend=MemoryBackend())
+        manager = fresh_manager
         invalidator = CacheInvalidator(manager)
 
         # 验证失效器已创建
@@ -65,110 +67,79 @@ class TestInvalidationComprehensive:
 class TestConfigurationComprehensive:
     """配置的全面测试"""
 
-    def test_config_from_env_variables(self) -> None:
+    def test_config_from_env_variables(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """测试从环境变量创建配置"""
-        import os
+        # 设置环境变量（测试结束后自动恢复）
+        monkeypatch.setenv("CACHE_BACKEND", "memory")
+        monkeypatch.setenv("CACHE_OPTIONS", "")
 
-        # 设置环境变量
-        os.environ["CACHE_BACKEND"] = "memory"
-        os.environ["CACHE_OPTIONS"] = ""
-
-        try:
-            manager = CacheManager.from_env()
-            assert isinstance(manager.backend, MemoryBackend)
-        finally:
-            # 清理
-            os.environ.pop("CACHE_BACKEND", None)
-            os.environ.pop("CACHE_OPTIONS", None)
-
-    def test_config_from_dict(self) -> None:
-        """测试从字典创建配置"""
-        config_dict = {"backend": "memory", "options": {"max_size": 1000}}
-
-        manager = CacheManager.from_config(config_dict)
+        manager = CacheManager.from_env()
         assert isinstance(manager.backend, MemoryBackend)
 
-    def test_config_from_config_object(self) -> None:
-        """测试从配置对象创建管理器"""
-        config = CacheConfig(backend="memory", options={"max_size": 1000})
+    @pytest.mark.parametrize("source", ["dict", "config", "yaml", "json"])
+    def test_config_sources(self, source: str, request: pytest.FixtureRequest) -> None:
+        """测试从字典、配置对象、YAML 与 JSON 文件创建管理器得到相同配置"""
+        if source == "dict":
+            manager = CacheManager.from_config(_MEMORY_CONFIG)
+        elif source == "config":
+            manager = CacheManager.from_config(CacheConfig(**_MEMORY_CONFIG))
+        else:
+            # 配置文件由 conftest 中的会话级 fixture 写入，内容与 _MEMORY_CONFIG 一致
+            manager = CacheManager.from_file(request.getfixturevalue(f"{source}_memory_config"))
 
-        manager = CacheManager.from_config(config)
         assert isinstance(manager.backend, MemoryBackend)
-
-    def test_config_from_yaml_file(self) -> None:
-        """测试从 YAML 文件创建配置"""
-        import yaml
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump({"backend": "memory", "options": {"max_size": 1000}}, f)
-            config_path = f.name
-
-        try:
-            manager = CacheManager.from_file(config_path)
-            assert isinstance(manager.backend, MemoryBackend)
-        finally:
-            Path(config_path).unlink()
-
-    def test_config_from_json_file(self) -> None:
-        """测试从 JSON 文件创建配置"""
-        import json
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump({"backend": "memory", "options": {}}, f)
-            config_path = f.name
-
-        try:
-            manager = CacheManager.from_file(config_path)
-            assert isinstance(manager.backend, MemoryBackend)
-        finally:
-            Path(config_path).unlink()
+        assert manager.backend.max_size == 5000
+        assert manager.backend.cleanup_interval == 120
 
 
 class TestManagerAdditionalMethods:
     """管理器额外方法的测试"""
 
-    def test_manager_with_multiple_backends(self) -> None:
+    def test_manager_with_multiple_backends(
+        self, fresh_manager: CacheManager, db_path: Path
+    ) -> None:
         """测试管理器的多后端切换"""
-        manager = CacheManager(backend=MemoryBackend())
+        manager = fresh_manager
 
         # 在内存后端中设置
         manager.set("key", "value1")
         assert manager.get("key") == "value1"
 
         # 切换到文件后端
-        with tempfile.TemporaryDirectory() as tmpdir:
-            file_backend = FileBackend(db_path=Path(tmpdir) / "cache.db")
+        file_backend = FileBackend(db_path=db_path)
+        try:
             manager.switch_backend(file_backend)
 
             # 文件后端中应该没有该值（不同的存储）
             # 但可以设置新值
             manager.set("key", "value2")
             assert manager.get("key") == "value2"
+        finally:
+            file_backend.close(fsync=False)
 
-    def test_manager_health_check(self) -> None:
+    def test_manager_health_check(self, fresh_manager: CacheManager) -> None:
         """测试管理器的健康检查"""
-        manager = CacheManager(backend=MemoryBackend())
+        manager = fresh_manager
 
         # 健康检查应该返回 True
         health = manager.check_health()
         assert health is True
 
     @pytest.mark.asyncio
-    async def test_manager_async_health_check(self) -> None:
+    async def test_manager_async_health_check(self, fresh_manager: CacheManager) -> None:
         """测试管理器的异步健康检查"""
-        manager = CacheManager(backend=MemoryBackend())
+        manager = fresh_manager
 
         # 异步健康检查
         health = await manager.acheck_health()
         assert health is True
 
-    def test_manager_keys(self) -> None:
+    def test_manager_keys(self, fresh_manager: CacheManager) -> None:
         """测试管理器的键获取"""
-        manager = CacheManager(backend=MemoryBackend())
+        manager = fresh_manager
 
         # 设置多个键
-        for i in range(5):
-            manager.set(f"key_{i}", f"value_{i}")
+        manager.set_many({f"key_{i}": f"value_{i}" for i in range(5)})
 
         # 获取键（可能返回 KeysPage 对象）
         result = manager.keys("key_*")
@@ -177,9 +148,9 @@ class TestManagerAdditionalMethods:
         assert result is not None
 
     @pytest.mark.asyncio
-    async def test_manager_async_operations(self) -> None:
+    async def test_manager_async_operations(self, fresh_manager: CacheManager) -> None:
         """测试管理器的异步操作"""
-        manager = CacheManager(backend=MemoryBackend())
+        manager = fresh_manager
 
         # 异步设置和获取
         await manager.aset("async_key", "async_value")
@@ -203,9 +174,9 @@ class TestManagerAdditionalMethods:
 class TestSerializationEdgeCases:
     """序列化的边界情况"""
 
-    def test_serialization_of_nested_structures(self) -> None:
+    def test_serialization_of_nested_structures(self, fresh_manager: CacheManager) -> None:
         """测试嵌套结构的序列化"""
-        manager = CacheManager(backend=MemoryBackend())
+        manager = fresh_manager
 
         complex_data = {
             "level1": {"level2": {"level3": [1, 2, {"level4": "value"}]}},
@@ -219,9 +190,9 @@ class TestSerializationEdgeCases:
         # 验证结构（注意：元组可能被转换为列表）
         assert retrieved is not None
 
-    def test_serialization_with_special_values(self) -> None:
+    def test_serialization_with_special_values(self, fresh_manager: CacheManager) -> None:
         """测试特殊值的序列化"""
-        manager = CacheManager(backend=MemoryBackend())
+        manager = fresh_manager
 
         special_values = {
             "empty_string": "",
@@ -233,9 +204,10 @@ class TestSerializationEdgeCases:
             "large_number": 10**100,
         }
 
+        manager.set_many(special_values)
+        retrieved = manager.get_many(list(special_values))
+
         for key, value in special_values.items():
-            manager.set(key, value)
-            retrieved = manager.get(key)
             # 对于 None 值，可能不会被缓存
             if value is not None:
-                assert retrieved == value or retrieved is None
+                assert retrieved.get(key) == value
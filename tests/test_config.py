@@ -5,12 +5,9 @@
 """
 
 import os
-import tempfile
 from pathlib import Path
 
 import pytest
-import toml
-import yaml
 from symphra_cache.backends import MemoryBackend
 from symphra_cache.config import CacheConfig
 from symphra_cache.exceptions import CacheConfigError
@@ -39,6 +36,15 @@ class TestCacheConfig:
         assert config.backend == "memory"
         assert config.options["max_size"] == 5000
 
+    def test_config_is_frozen(self) -> None:
+        """测试配置创建后不可重新赋值"""
+        from pydantic import ValidationError
+
+        config = CacheConfig(backend="memory")
+
+        with pytest.raises(ValidationError):
+            config.backend = "file"
+
     def test_create_backend(self) -> None:
         """测试创建后端实例"""
         config = CacheConfig(backend="memory", options={"max_size": 1000})
@@ -77,87 +83,98 @@ class TestCacheConfig:
 class TestConfigFileLoading:
     """测试配置文件加载"""
 
-    def test_load_from_yaml(self) -> None:
+    def test_load_from_yaml(self, yaml_memory_config: Path) -> None:
         """测试从 YAML 文件加载"""
-        config_data = {"backend": "memory", "options": {"max_size": 3000}}
+        config = CacheConfig.from_file(yaml_memory_config)
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = f.name
+        assert config.backend == "memory"
+        assert config.options["max_size"] == 5000
 
-        try:
-            config = CacheConfig.from_file(config_path)
+    def test_load_from_yml(self, yml_memory_config: Path) -> None:
+        """测试从 .yml 文件加载"""
+        config = CacheConfig.from_file(yml_memory_config)
 
-            assert config.backend == "memory"
-            assert config.options["max_size"] == 3000
-        finally:
-            Path(config_path).unlink()
+        assert config.backend == "memory"
 
-    def test_load_from_yml(self) -> None:
-        """测试从 .yml 文件加载"""
-        config_data = {"backend": "memory", "options": {}}
+    def test_load_from_toml(self, toml_file_config: Path) -> None:
+        """测试从 TOML 文件加载"""
+        config = CacheConfig.from_file(toml_file_config)
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = f.name
+        assert config.backend == "file"
+        assert config.options["db_path"] == "/tmp/test.db"
 
-        try:
-            config = CacheConfig.from_file(config_path)
+    def test_load_from_json(self, json_memory_config: Path) -> None:
+        """测试从 JSON 文件加载"""
+        config = CacheConfig.from_file(json_memory_config)
 
-            assert config.backend == "memory"
-        finally:
-            Path(config_path).unlink()
+        assert config.backend == "memory"
+        assert config.options["max_size"] == 5000
 
-    def test_load_from_toml(self) -> None:
-        """测试从 TOML 文件加载"""
-        config_data = {"backend": "file", "options": {"db_path": "/tmp/test.db"}}
+    def test_load_from_json_without_orjson(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """测试未安装 orjson 时回退到标准库 JSON 解析"""
+        import symphra_cache.serializers as serializers_module
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            toml.dump(config_data, f)
-            config_path = f.name
+        monkeypatch.setattr(serializers_module, "_orjson", None)
+        config_path = tmp_path / "cache.json"
+        config_path.write_text('{"backend": "memory", "options": {"max_size": 4000}}')
 
-        try:
-            config = CacheConfig.from_file(config_path)
+        config = CacheConfig.from_file(config_path)
+        assert config.options["max_size"] == 4000
 
-            assert config.backend == "file"
-            assert config.options["db_path"] == "/tmp/test.db"
-        finally:
-            Path(config_path).unlink()
+    def test_load_from_json_keeps_big_integers(self, tmp_path: Path) -> None:
+        """测试超出 64 位的整数原样加载，不被 orjson 转为浮点数"""
+        config_path = tmp_path / "cache.json"
+        config_path.write_text(
+            '{"backend": "memory", "options": {"seed": 123456789012345678901234567890}}'
+        )
 
-    def test_load_from_json(self) -> None:
-        """测试从 JSON 文件加载"""
-        import json
+        config = CacheConfig.from_file(config_path)
+        assert config.options["seed"] == 123456789012345678901234567890
 
-        config_data = {"backend": "memory", "options": {"max_size": 4000}}
+    def test_load_invalid_json(self, tmp_path: Path) -> None:
+        """测试 JSON 语法错误被包装为 CacheConfigError"""
+        config_path = tmp_path / "cache.json"
+        config_path.write_text("{not json")
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(config_data, f)
-            config_path = f.name
+        with pytest.raises(CacheConfigError, match="读取配置文件失败"):
+            CacheConfig.from_file(config_path)
 
-        try:
-            config = CacheConfig.from_file(config_path)
+    def test_load_from_file_cached(self, tmp_path: Path) -> None:
+        """测试重复加载同一文件命中缓存，文件变更后重新解析"""
+        from symphra_cache.config import _load_config_file
 
-            assert config.backend == "memory"
-            assert config.options["max_size"] == 4000
-        finally:
-            Path(config_path).unlink()
+        config_path = tmp_path / "cache.yaml"
+        config_path.write_text("backend: memory\noptions:\n  max_size: 100\n")
+
+        _load_config_file.cache_clear()
+        first = CacheConfig.from_file(config_path)
+        second = CacheConfig.from_file(config_path)
+        assert _load_config_file.cache_info().hits == 1
+
+        # 每次返回独立副本，修改不会污染缓存
+        assert first == second
+        assert first is not second
+        first.options["max_size"] = 1
+        assert CacheConfig.from_file(config_path).options["max_size"] == 100
+
+        # 文件内容变化后重新解析
+        config_path.write_text("backend: memory\noptions:\n  max_size: 20000\n")
+        assert CacheConfig.from_file(config_path).options["max_size"] == 20000
 
     def test_load_nonexistent_file(self) -> None:
         """测试加载不存在的文件"""
         with pytest.raises(CacheConfigError, match="配置文件不存在"):
             CacheConfig.from_file("/nonexistent/config.yaml")
 
-    def test_load_unsupported_format(self) -> None:
+    def test_load_unsupported_format(self, tmp_path: Path) -> None:
         """测试加载不支持的格式"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("backend: memory")
-            config_path = f.name
+        config_path = tmp_path / "cache.txt"
+        config_path.write_text("backend: memory")
 
-        try:
-            with pytest.raises(CacheConfigError, match="不支持的配置文件格式"):
-                CacheConfig.from_file(config_path)
-        finally:
-            Path(config_path).unlink()
+        with pytest.raises(CacheConfigError, match="不支持的配置文件格式"):
+            CacheConfig.from_file(config_path)
 
 
 class TestEnvironmentVariableLoading:
@@ -250,6 +267,9 @@ class TestConfigValidation:
         assert isinstance(backend2, MemoryBackend)
         assert isinstance(backend3, MemoryBackend)
 
+        # 名称在构造时统一规范化为小写
+        assert config1.backend == config2.backend == config3.backend == "memory"
+
     def test_options_defaults_to_empty_dict(self) -> None:
         """测试 options 默认为空字典"""
         config = CacheConfig(backend="memory")
@@ -261,19 +281,16 @@ class TestConfigValidation:
 class TestConfigIntegration:
     """测试配置与其他组件的集成"""
 
-    def test_create_file_backend(self) -> None:
+    def test_create_file_backend(self, db_path: Path) -> None:
         """测试创建文件后端"""
-        import tempfile
+        config = CacheConfig(backend="file", options={"db_path": str(db_path), "max_size": 1000})
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config = CacheConfig(
-                backend="file", options={"db_path": f"{tmpdir}/cache.db", "max_size": 1000}
-            )
-
-            backend = config.create_backend()
-
-            assert backend._db_path == Path(f"{tmpdir}/cache.db")
+        backend = config.create_backend()
+        try:
+            assert backend._db_path == db_path
             assert backend._max_size == 1000
+        finally:
+            backend.close()
 
     def test_create_memory_backend(self) -> None:
         """测试创建内存后端"""
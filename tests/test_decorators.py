@@ -6,18 +6,23 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 from symphra_cache import CacheManager
 from symphra_cache.backends import MemoryBackend
 from symphra_cache.decorators import acache, cache
 
+if TYPE_CHECKING:
+    from tests.conftest import FakeClock
+
 
 class TestCacheDecorator:
     """测试同步缓存装饰器"""
 
-    def test_basic_caching(self) -> None:
+    def test_basic_caching(self, fresh_manager: CacheManager) -> None:
         """测试基础缓存功能"""
-        manager = CacheManager(backend=MemoryBackend())
+        manager = fresh_manager
         call_count = 0
 
         @cache(manager)
@@ -41,11 +46,10 @@ class TestCacheDecorator:
         assert result3 == 20
         assert call_count == 2
 
-    def test_cache_with_ttl(self) -> None:
+    def test_cache_with_ttl(self, clock: FakeClock) -> None:
         """测试带 TTL 的缓存"""
-        import time
-
-        manager = CacheManager(backend=MemoryBackend())
+        # 注入模拟时钟，推进逻辑时间代替真实等待
+        manager = CacheManager(backend=MemoryBackend(time_func=clock))
         call_count = 0
 
         @cache(manager, ttl=1)
@@ -64,15 +68,15 @@ class TestCacheDecorator:
         assert result2 == 15
         assert call_count == 1
 
-        # 等待过期后调用
-        time.sleep(1.1)
+        # 过期后调用
+        clock.advance(1.1)
         result3 = timed_function(5)
         assert result3 == 15
         assert call_count == 2
 
-    def test_cache_with_prefix(self) -> None:
+    def test_cache_with_prefix(self, fresh_manager: CacheManager) -> None:
         """测试键前缀"""
-        manager = CacheManager(backend=MemoryBackend())
+        manager = fresh_manager
 
         @cache(manager, key_prefix="user:")
         def get_user(user_id: int) -> dict[str, object]:
@@ -89,9 +93,9 @@ class TestAsyncCacheDecorator:
     """测试异步缓存装饰器"""
 
     @pytest.mark.asyncio
-    async def test_basic_async_caching(self) -> None:
+    async def test_basic_async_caching(self, fresh_manager: CacheManager) -> None:
         """测试异步缓存"""
-        manager = CacheManager(backend=MemoryBackend())
+        manager = fresh_manager
         call_count = 0
 
         @acache(manager)
@@ -114,9 +118,9 @@ class TestAsyncCacheDecorator:
 class TestCacheInvalidateDecorator:
     """测试缓存失效装饰器"""
 
-    def test_cache_invalidation(self) -> None:
+    def test_cache_invalidation(self, fresh_manager: CacheManager) -> None:
         """测试缓存失效"""
-        manager = CacheManager(backend=MemoryBackend())
+        manager = fresh_manager
         call_count = 0
 
         @cache(manager)
@@ -144,11 +148,11 @@ class TestCacheInvalidateDecorator:
         assert result3 == 10
         assert call_count == 2
 
-    def test_cache_invalidate_decorator(self) -> None:
+    def test_cache_invalidate_decorator(self, fresh_manager: CacheManager) -> None:
         """测试 cache_invalidate 装饰器"""
         from symphra_cache.decorators import cache_invalidate, default_key_builder
 
-        manager = CacheManager(backend=MemoryBackend())
+        manager = fresh_manager
         call_count = 0
         update_count = 0
 
@@ -182,9 +186,62 @@ class TestCacheInvalidateDecorator:
         assert result3 == "value_test"
         assert call_count == 2
 
-    def test_cache_with_none_value(self) -> None:
+    def test_default_key_builder_format(self) -> None:
+        """测试默认键格式稳定，且位置参数与关键字参数生成相同的键"""
+        import hashlib
+        import json
+
+        from symphra_cache.decorators import default_key_builder
+
+        def get_user(user_id: int, include_posts: bool = False) -> None:
+            pass
+
+        expected_hash = hashlib.md5(
+            json.dumps({"user_id": 1, "include_posts": True}, sort_keys=True).encode("utf-8"),
+            usedforsecurity=False,
+        ).hexdigest()
+        expected = f"{get_user.__module__}.{get_user.__qualname__}:{expected_hash}"
+
+        assert default_key_builder(get_user, (1, True), {}) == expected
+        assert default_key_builder(get_user, (1,), {"include_posts": True}) == expected
+
+    @pytest.mark.parametrize(
+        ("args", "kwargs"),
+        [
+            ((1,), {}),
+            ((1, 2), {}),
+            ((1, 2, 3), {}),
+            ((1,), {"c": 3}),
+            ((), {"a": 1, "b": 2}),
+            ((1, 2, 3, 4), {}),  # 位置参数过多
+            ((1,), {"a": 1}),  # 重复参数
+            ((1,), {"d": 1}),  # 未知参数
+            ((), {}),  # 缺少必需参数
+        ],
+    )
+    def test_binder_matches_signature_bind(
+        self, args: tuple[object, ...], kwargs: dict[str, object]
+    ) -> None:
+        """测试专用参数绑定器与 Signature.bind 结果一致"""
+        import inspect
+
+        from symphra_cache.decorators import _make_binder
+
+        def func(a: int, b: int = 2, c: int = 3) -> None:
+            pass
+
+        try:
+            bound = inspect.signature(func).bind(*args, **kwargs)
+        except TypeError:
+            with pytest.raises(TypeError):
+                _make_binder(func)(args, kwargs)
+        else:
+            bound.apply_defaults()
+            assert _make_binder(func)(args, kwargs) == dict(bound.arguments)
+
+    def test_cache_with_none_value(self, fresh_manager: CacheManager) -> None:
         """测试缓存不缓存 None 值"""
-        manager = CacheManager(backend=MemoryBackend())
+        manager = fresh_manager
         call_count = 0
 
         @cache(manager)
@@ -213,9 +270,9 @@ class TestCacheInvalidateDecorator:
         assert result4 == "value"
         assert call_count == 3
 
-    def test_cache_with_custom_key_builder(self) -> None:
+    def test_cache_with_custom_key_builder(self, fresh_manager: CacheManager) -> None:
         """测试自定义键生成函数"""
-        manager = CacheManager(backend=MemoryBackend())
+        manager = fresh_manager
         call_count = 0
 
         def custom_key_builder(func, args, kwargs):
@@ -243,9 +300,9 @@ class TestCacheInvalidateDecorator:
         assert result3 == 20
         assert call_count == 2
 
-    def test_cache_with_non_serializable_param(self) -> None:
+    def test_cache_with_non_serializable_param(self, fresh_manager: CacheManager) -> None:
         """测试不可序列化参数的处理"""
-        manager = CacheManager(backend=MemoryBackend())
+        manager = fresh_manager
         call_count = 0
 
         @cache(manager)
@@ -273,11 +330,11 @@ class TestCacheInvalidateDecorator:
 class TestCachedProperty:
     """测试缓存属性装饰器"""
 
-    def test_cached_property_basic(self) -> None:
+    def test_cached_property_basic(self, fresh_manager: CacheManager) -> None:
         """测试缓存属性基本功能"""
         from symphra_cache.decorators import CachedProperty
 
-        manager = CacheManager(backend=MemoryBackend())
+        manager = fresh_manager
         call_count = 0
 
         class User:
@@ -302,13 +359,11 @@ class TestCachedProperty:
         assert profile2["id"] == 123
         assert call_count == 1
 
-    def test_cached_property_with_ttl(self) -> None:
+    def test_cached_property_with_ttl(self, clock: FakeClock) -> None:
         """测试带 TTL 的缓存属性"""
-        import time
-
         from symphra_cache.decorators import CachedProperty
 
-        manager = CacheManager(backend=MemoryBackend())
+        manager = CacheManager(backend=MemoryBackend(time_func=clock))
         call_count = 0
 
         class User:
@@ -333,19 +388,19 @@ class TestCachedProperty:
         assert profile2["id"] == 123
         assert call_count == 1
 
-        # 等待过期
-        time.sleep(1.1)
+        # 推进时钟至过期
+        clock.advance(1.1)
 
         # 过期后访问：重新计算
         profile3 = user.profile
         assert profile3["id"] == 123
         assert call_count == 2
 
-    def test_cached_property_with_prefix(self) -> None:
+    def test_cached_property_with_prefix(self, fresh_manager: CacheManager) -> None:
         """测试缓存属性键前缀"""
         from symphra_cache.decorators import CachedProperty
 
-        manager = CacheManager(backend=MemoryBackend())
+        manager = fresh_manager
         call_count = 0
 
         class User:
@@ -365,11 +420,11 @@ class TestCachedProperty:
         assert profile["id"] == 123
         assert call_count == 1
 
-    def test_cached_property_different_instances(self) -> None:
+    def test_cached_property_different_instances(self, fresh_manager: CacheManager) -> None:
         """测试不同实例有不同的缓存"""
         from symphra_cache.decorators import CachedProperty
 
-        manager = CacheManager(backend=MemoryBackend())
+        manager = fresh_manager
         call_count = 0
 
         class User:
@@ -403,11 +458,11 @@ class TestCachedProperty:
         assert profile2_again["id"] == 456
         assert call_count == 2
 
-    def test_cached_property_on_class(self) -> None:
+    def test_cached_property_on_class(self, fresh_manager: CacheManager) -> None:
         """测试在类上访问缓存属性返回描述器本身"""
         from symphra_cache.decorators import CachedProperty
 
-        manager = CacheManager(backend=MemoryBackend())
+        manager = fresh_manager
 
         class User:
             @CachedProperty(manager)
@@ -417,11 +472,11 @@ class TestCachedProperty:
         # 在类上访问应该返回描述器本身
         assert isinstance(User.profile, CachedProperty)
 
-    def test_cached_property_with_none_value(self) -> None:
+    def test_cached_property_with_none_value(self, fresh_manager: CacheManager) -> None:
         """测试缓存属性不缓存 None 值"""
         from symphra_cache.decorators import CachedProperty
 
-        manager = CacheManager(backend=MemoryBackend())
+        manager = fresh_manager
         call_count = 0
 
         class User:
@@ -446,11 +501,11 @@ class TestCachedProperty:
         assert profile2 is None
         assert call_count == 2
 
-    def test_cached_property_uninitialized(self) -> None:
+    def test_cached_property_uninitialized(self, fresh_manager: CacheManager) -> None:
         """测试未初始化的缓存属性"""
         from symphra_cache.decorators import CachedProperty
 
-        manager = CacheManager(backend=MemoryBackend())
+        manager = fresh_manager
 
         cached_prop = CachedProperty(manager)
 
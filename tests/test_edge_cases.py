@@ -6,10 +6,15 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 from symphra_cache import CacheManager
 from symphra_cache.backends import FileBackend, MemoryBackend
 
+if TYPE_CHECKING:
+    from tests.conftest import FakeClock
+
 
 class TestManagerEdgeCases:
     """测试管理器的边界情况"""
@@ -80,6 +85,63 @@ class TestManagerEdgeCases:
         assert result2 == "async_1"
         assert call_count == 1
 
+    def test_get_or_set_single_flight(self) -> None:
+        """测试并发 get_or_set 同一键只计算一次"""
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        manager = CacheManager(backend=MemoryBackend())
+        entered = threading.Event()
+        call_count = 0
+
+        def compute() -> str:
+            nonlocal call_count
+            call_count += 1
+            entered.set()
+            time.sleep(0.05)
+            return "shared"
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            leader = pool.submit(manager.get_or_set, "key", compute)
+            entered.wait()
+            waiters = [pool.submit(manager.get_or_set, "key", compute) for _ in range(4)]
+            results = [leader.result()] + [f.result() for f in waiters]
+
+        assert results == ["shared"] * 5
+        assert call_count == 1
+        assert manager._inflight == {}
+
+    def test_get_or_set_reentrant_same_key(self) -> None:
+        """测试工厂函数内对同一键重入 get_or_set 不会死锁"""
+        manager = CacheManager(backend=MemoryBackend())
+
+        def outer() -> str:
+            return "outer+" + manager.get_or_set("key", lambda: "inner")
+
+        assert manager.get_or_set("key", outer) == "outer+inner"
+        assert manager.get("key") == "outer+inner"
+        assert manager._inflight == {}
+
+    async def test_aget_or_set_single_flight(self, tmp_path) -> None:
+        """测试并发 aget_or_set 同一键只计算一次"""
+        import asyncio
+
+        manager = CacheManager(backend=FileBackend(db_path=tmp_path / "cache.db"))
+        call_count = 0
+
+        def compute() -> str:
+            nonlocal call_count
+            call_count += 1
+            return "shared"
+
+        results = await asyncio.gather(*(manager.aget_or_set("key", compute) for _ in range(5)))
+
+        assert results == ["shared"] * 5
+        assert call_count == 1
+        assert manager._ainflight == {}
+        manager._backend.close(fsync=False)
+
     def test_increment_operation(self) -> None:
         """测试递增操作"""
         manager = CacheManager(backend=MemoryBackend())
@@ -114,6 +176,18 @@ class TestManagerEdgeCases:
         result = manager.decrement("counter", 3)
         assert result == 7
 
+    async def test_aincrement_keeps_ttl(self, tmp_path, clock: FakeClock) -> None:
+        """测试异步递增经由后端 aincr 完成并保留过期时间"""
+        manager = CacheManager(backend=FileBackend(db_path=tmp_path / "cache.db", time_func=clock))
+
+        await manager.aset("counter", 10, ttl=60)
+        assert await manager.aincrement("counter", 5) == 15
+        assert await manager.adecrement("counter", 3) == 12
+
+        clock.advance(61)
+        assert await manager.aget("counter") is None
+        manager._backend.close(fsync=False)
+
     def test_ttl_on_key(self) -> None:
         """测试获取键的 TTL"""
 
@@ -36,19 +36,15 @@ class TestCacheManagerBasics:
 
         assert isinstance(manager.backend, MemoryBackend)
 
-    def test_initialization_from_file(self) -> None:
+    def test_initialization_from_file(self, tmp_path: Path) -> None:
         """测试从配置文件初始化"""
         import yaml
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump({"backend": "memory", "options": {"max_size": 1000}}, f)
-            config_path = f.name
+        config_path = tmp_path / "cache.yaml"
+        config_path.write_text(yaml.safe_dump({"backend": "memory", "options": {"max_size": 1000}}))
 
-        try:
-            manager = CacheManager.from_file(config_path)
-            assert isinstance(manager.backend, MemoryBackend)
-        finally:
-            Path(config_path).unlink()
+        manager = CacheManager.from_file(config_path)
+        assert isinstance(manager.backend, MemoryBackend)
 
     def test_get_set_delete(self) -> None:
         """测试基础操作"""
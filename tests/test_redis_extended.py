@@ -164,6 +164,43 @@ class TestRedisBackendWithMockOperations:
         except ImportError:
             pytest.skip("redis 未安装")
 
+    @patch("redis.Redis")
+    @patch("redis.asyncio.Redis")
+    def test_redis_backend_incr_json_uses_incrby(self, mock_aioredis, mock_redis) -> None:
+        """测试 JSON 序列化时 incr 直接使用 INCRBY"""
+        mock_redis_instance = MagicMock()
+        mock_redis.return_value = mock_redis_instance
+        mock_redis_instance.incrby.return_value = 11
+
+        backend = RedisBackend(serialization_mode="json")
+
+        assert backend.incr("counter") == 11
+        mock_redis_instance.incrby.assert_called_once_with("symphra:counter", 1)
+
+    @patch("redis.Redis")
+    @patch("redis.asyncio.Redis")
+    def test_redis_backend_incr_pickle_keeps_ttl(self, mock_aioredis, mock_redis) -> None:
+        """测试 Pickle 序列化时 incr 以 SET KEEPTTL 写回序列化后的值"""
+        import pickle
+
+        mock_redis_instance = MagicMock()
+        mock_redis.return_value = mock_redis_instance
+        pipe = mock_redis_instance.pipeline.return_value.__enter__.return_value
+        pipe.get.return_value = pickle.dumps(10)
+
+        backend = RedisBackend()
+
+        assert backend.decr("counter", 3) == 7
+        pipe.watch.assert_called_once_with("symphra:counter")
+        pipe.set.assert_called_once_with(
+            "symphra:counter", PickleSerializer().serialize(7), keepttl=True
+        )
+        mock_redis_instance.incrby.assert_not_called()
+
+        pipe.get.return_value = pickle.dumps("text")
+        with pytest.raises(ValueError, match="不是整数"):
+            backend.incr("counter")
+
     @patch("redis.Redis")
     @patch("redis.asyncio.Redis")
     def test_redis_backend_ttl_operation(self, mock_aioredis, mock_redis) -> None:
@@ -204,6 +241,23 @@ class TestRedisBackendWithMockOperations:
         except ImportError:
             pytest.skip("redis 未安装")
 
+    @patch("redis.Redis")
+    @patch("redis.asyncio.Redis")
+    def test_redis_backend_keys_rejects_non_positive_count(self, mock_aioredis, mock_redis) -> None:
+        """测试 count 非正数时拒绝扫描"""
+        mock_redis_instance = MagicMock()
+        mock_redis.return_value = mock_redis_instance
+        mock_redis_instance.ping.return_value = True
+
+        mock_aioredis_instance = AsyncMock()
+        mock_aioredis.return_value = mock_aioredis_instance
+
+        backend = RedisBackend(host="localhost", port=6379)
+        for count in (0, -1):
+            with pytest.raises(ValueError, match="count"):
+                backend.keys(count=count)
+        mock_redis_instance.scan.assert_not_called()
+
     @patch("redis.Redis")
     @patch("redis.asyncio.Redis")
     def test_redis_backend_clear_operation(self, mock_aioredis, mock_redis) -> None:
@@ -81,6 +81,98 @@ class TestJSONSerializerErrors:
 
         assert deserialized == data
 
+    def test_json_non_str_keys_match_stdlib(self) -> None:
+        """测试非字符串键与标准库一样转为字符串"""
+        serializer = JSONSerializer()
+
+        assert serializer.deserialize(serializer.serialize({1: "a", 2.5: "b"})) == {
+            "1": "a",
+            "2.5": "b",
+        }
+
+    def test_json_stdlib_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """测试未安装 orjson 时回退到标准库"""
+        from symphra_cache import serializers
+
+        monkeypatch.setattr(serializers, "_orjson", None)
+        serializer = JSONSerializer()
+
+        data = {"name": "你好", "count": 3, "items": [1, 2]}
+        assert serializer.deserialize(serializer.serialize(data)) == data
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_non_finite_floats_roundtrip(
+        self, use_orjson: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """测试 NaN 与 ±Infinity 往返不变，与是否安装 orjson 无关"""
+        import math
+
+        from symphra_cache import serializers
+
+        if not use_orjson:
+            monkeypatch.setattr(serializers, "_orjson", None)
+        serializer = JSONSerializer()
+
+        result = serializer.deserialize(
+            serializer.serialize(
+                {"nan": math.nan, "inf": math.inf, "ninf": -math.inf, "none": None}
+            )
+        )
+
+        assert math.isnan(result["nan"])
+        assert result["inf"] == math.inf
+        assert result["ninf"] == -math.inf
+        assert result["none"] is None
+
+    def test_json_none_does_not_fall_back_to_stdlib(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """测试含 None 的普通值直接使用 orjson 输出，只有非有限浮点数才回退"""
+        import math
+
+        from symphra_cache import serializers
+
+        if serializers._orjson is None:
+            pytest.skip("orjson 未安装")
+
+        stdlib_calls = 0
+        original_dumps = serializers.json.dumps
+
+        def counting_dumps(*args, **kwargs):
+            nonlocal stdlib_calls
+            stdlib_calls += 1
+            return original_dumps(*args, **kwargs)
+
+        monkeypatch.setattr(serializers.json, "dumps", counting_dumps)
+        serializer = JSONSerializer()
+
+        serializer.serialize({"user": {"name": "a", "score": 1.5, "email": None}, "tags": [None]})
+        assert stdlib_calls == 0
+
+        serializer.serialize({"user": {"score": math.nan, "email": None}})
+        assert stdlib_calls == 1
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_enum_and_uuid_match_orjson(
+        self, use_orjson: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """测试 Enum 与 UUID 的编码与是否安装 orjson 无关"""
+        import enum
+        import uuid
+
+        from symphra_cache import serializers
+
+        class Color(enum.Enum):
+            RED = "red"
+
+        if not use_orjson:
+            monkeypatch.setattr(serializers, "_orjson", None)
+        serializer = JSONSerializer()
+        ident = uuid.UUID("12345678-1234-5678-1234-567812345678")
+
+        assert serializer.deserialize(serializer.serialize([Color.RED, ident])) == [
+            "red",
+            str(ident),
+        ]
+
 
 class TestPickleSerializerErrors:
     """测试 Pickle 序列化器的错误处理"""
@@ -33,10 +33,11 @@ class TestEvictionPolicy:
         assert EvictionPolicy.LRU.value == "lru"
         assert EvictionPolicy.LFU.value == "lfu"
         assert EvictionPolicy.FIFO.value == "fifo"
+        assert EvictionPolicy.TINYLFU.value == "tinylfu"
 
     def test_enum_count(self) -> None:
         """测试枚举成员数量"""
-        assert len(EvictionPolicy) == 3
+        assert len(EvictionPolicy) == 4
 
 
 class TestBackendType:
@@ -54,3 +55,10 @@ class TestBackendType:
         assert BackendType.MEMORY.value == "memory"
         assert BackendType.FILE.value == "file"
         assert BackendType.REDIS.value == "redis"
+
+    def test_str_enum_behaviour(self) -> None:
+        """测试 StrEnum 的字符串行为"""
+        assert str(BackendType.MEMORY) == "memory"
+        assert f"{SerializationMode.JSON}" == "json"
+        assert BackendType.REDIS == "redis"
+        assert {SerializationMode.PICKLE: 1}["pickle"] == 1
@@ -6,7 +6,9 @@
 
 import asyncio
 import json
-import tempfile
+import logging
+import sys
+import threading
 import time
 from pathlib import Path
 
@@ -148,7 +150,7 @@ class TestCacheWarmerAuto:
         assert call_count >= 2
 
     @pytest.mark.asyncio
-    async def test_auto_warm_up_with_error(self) -> None:
+    async def test_auto_warm_up_with_error(self, caplog: pytest.LogCaptureFixture) -> None:
         """测试自动预热错误处理"""
         cache = CacheManager(backend=MemoryBackend())
         warmer = CacheWarmer(cache)
@@ -156,8 +158,12 @@ class TestCacheWarmerAuto:
         def failing_data_source():
             raise ValueError("模拟数据源错误")
 
-        # 应该不抛出异常
-        await warmer.auto_warm_up(failing_data_source)
+        # 应该不抛出异常，错误通过日志记录
+        with caplog.at_level(logging.ERROR, logger="symphra_cache.warming"):
+            await warmer.auto_warm_up(failing_data_source)
+
+        assert "自动预热失败" in caplog.text
+        assert "模拟数据源错误" in caplog.text
 
         # 缓存应该为空
         assert len(cache) == 0
@@ -192,6 +198,36 @@ class TestCacheWarmerIncremental:
         for key in hot_keys:
             assert cache.get(key) == f"hot_data_for_{key}"
 
+    @pytest.mark.asyncio
+    async def test_incremental_warm_up_overlaps_loads(self) -> None:
+        """测试增量预热并发加载各批次，且单批失败不影响其他批次"""
+        cache = CacheManager(backend=MemoryBackend())
+        warmer = CacheWarmer(cache, batch_size=2, concurrency=3)
+
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def data_loader(keys):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            if "bad" in keys:
+                raise ValueError("模拟加载失败")
+            return {key: f"loaded_{key}" for key in keys}
+
+        hot_keys = [f"k{i}" for i in range(8)] + ["bad"]
+        await warmer.incremental_warm_up(hot_keys, data_loader)
+
+        assert peak == 3
+        for key in hot_keys[:8]:
+            assert cache.get(key) == f"loaded_{key}"
+        assert cache.get("bad") is None
+
 
 class TestCacheWarmerSmart:
     """测试智能预热功能"""
@@ -223,6 +259,87 @@ class TestCacheWarmerSmart:
         assert "hot_key1" in hot_keys
         assert "hot_key2" in hot_keys
 
+    def test_access_pattern_record(self) -> None:
+        """测试访问模式记录的计数与时间戳"""
+        cache = CacheManager(backend=MemoryBackend())
+        smart_warmer = SmartCacheWarmer(cache)
+
+        for _ in range(3):
+            smart_warmer.record_cache_miss("tracked")
+
+        pattern = smart_warmer._access_patterns["tracked"]
+        assert pattern.count == 3
+        assert pattern.first_access <= pattern.last_access
+        assert not hasattr(pattern, "__dict__")
+
+    def test_access_pattern_bulk_record(self) -> None:
+        """测试批量记录访问模式共用同一时间戳"""
+        cache = CacheManager(backend=MemoryBackend())
+        warmer = CacheWarmer(cache)
+
+        warmer._record_access_pattern_bulk(["a", "b", "a"], 100)
+
+        assert warmer._access_patterns["a"].count == 2
+        assert warmer._access_patterns["b"].count == 1
+        assert warmer._access_patterns["a"].last_access == 100
+        assert warmer._access_patterns["b"].first_access == 100
+
+    def test_access_pattern_interns_str_keys(self) -> None:
+        """测试字符串键在记录时被驻留"""
+        cache = CacheManager(backend=MemoryBackend())
+        warmer = CacheWarmer(cache)
+
+        key = "".join(["interned", "_key"])
+        warmer._record_access_pattern(key)
+
+        stored = next(iter(warmer._access_patterns))
+        assert stored is sys.intern("interned_key")
+
+    def test_access_patterns_bounded(self) -> None:
+        """测试访问模式跟踪表有上限，淘汰最久未访问的键"""
+        cache = CacheManager(backend=MemoryBackend())
+        warmer = CacheWarmer(cache, max_tracked_keys=3)
+
+        for key in ("a", "b", "c"):
+            warmer._record_access_pattern(key)
+        warmer._record_access_pattern("a")
+        warmer._record_access_pattern("d")
+
+        assert list(warmer._access_patterns) == ["c", "a", "d"]
+        assert warmer._access_patterns["a"].count == 2
+
+    def test_admission_threshold_skips_one_shot_keys(self) -> None:
+        """测试准入阈值过滤只访问一次的键"""
+        cache = CacheManager(backend=MemoryBackend())
+        warmer = CacheWarmer(cache, admission_threshold=2)
+
+        for i in range(100):
+            warmer._record_access_pattern(f"once_{i}")
+        warmer._record_access_pattern("repeat")
+        warmer._record_access_pattern("repeat")
+        warmer._record_access_pattern("repeat")
+
+        assert "repeat" in warmer._access_patterns
+        assert warmer._access_patterns["repeat"].count == 3
+        assert len(warmer._access_patterns) < 10
+
+    def test_analyze_access_patterns_decay(self) -> None:
+        """测试热度评分随时间衰减"""
+        cache = CacheManager(backend=MemoryBackend())
+        smart_warmer = SmartCacheWarmer(cache)
+
+        for _ in range(4):
+            smart_warmer.record_cache_miss("fresh")
+            smart_warmer.record_cache_miss("stale")
+
+        # 将 stale 的最近访问时间调到 25 小时前
+        smart_warmer._access_patterns["stale"].last_access -= 25 * 3600 * 1_000_000_000
+
+        scores = smart_warmer._analyze_access_patterns()
+
+        assert scores["fresh"] == pytest.approx(4.0, rel=1e-3)
+        assert scores["stale"] == 0.0
+
     @pytest.mark.asyncio
     async def test_smart_warm_up(self) -> None:
         """测试智能预热"""
@@ -245,12 +362,33 @@ class TestCacheWarmerSmart:
         for key in hot_keys:
             assert cache.get(key) == f"smart_data_{key}"
 
+    @pytest.mark.asyncio
+    async def test_smart_warm_up_top_k_order(self) -> None:
+        """测试智能预热只加载热度最高的 K 个键"""
+        cache = CacheManager(backend=MemoryBackend())
+        smart_warmer = SmartCacheWarmer(cache)
+
+        for key, hits in (("warm", 3), ("cold", 1), ("hot", 5)):
+            for _ in range(hits):
+                smart_warmer.record_cache_miss(key)
+
+        requested: list[str] = []
+
+        def data_loader(keys):
+            requested.extend(keys)
+            return {key: key for key in keys}
+
+        await smart_warmer.smart_warm_up(data_loader, top_k=2)
+
+        assert requested == ["hot", "warm"]
+        assert cache.get("cold") is None
+
 
 class TestCacheWarmerFile:
     """测试文件预热功能"""
 
     @pytest.mark.asyncio
-    async def test_warm_up_from_json_file(self) -> None:
+    async def test_warm_up_from_json_file(self, tmp_path: Path) -> None:
         """测试从 JSON 文件预热"""
         cache = CacheManager(backend=MemoryBackend())
         warmer = CacheWarmer(cache)
@@ -262,19 +400,92 @@ class TestCacheWarmerFile:
             "feature:flag1": True,
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(test_data, f)
-            temp_file = f.name
+        temp_file = tmp_path / "data.json"
+        temp_file.write_text(json.dumps(test_data))
+
+        await warmer.warm_up_from_file(temp_file, format="json", ttl=3600)
+
+        # 验证数据已加载
+        for key, value in test_data.items():
+            assert cache.get(key) == value
+
+    @pytest.mark.asyncio
+    async def test_warm_up_from_csv_file(self, tmp_path: Path) -> None:
+        """测试从 CSV 文件预热（按表头定位列，跳过残缺行）"""
+        cache = CacheManager(backend=MemoryBackend())
+        warmer = CacheWarmer(cache)
+
+        file_path = tmp_path / "data.csv"
+        file_path.write_text(
+            "note,value,key\nfirst,v1,k1\nsecond,v2,k2\nbroken\n", encoding="utf-8"
+        )
+
+        await warmer.warm_up_from_file(str(file_path), format="csv")
 
-        try:
-            await warmer.warm_up_from_file(temp_file, format="json", ttl=3600)
+        assert cache.get("k1") == "v1"
+        assert cache.get("k2") == "v2"
+        assert len(cache) == 2
 
-            # 验证数据已加载
-            for key, value in test_data.items():
-                assert cache.get(key) == value
+    @pytest.mark.asyncio
+    async def test_warm_up_from_csv_file_reads_in_thread(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """测试 CSV 文件在工作线程中读取，不阻塞事件循环"""
+        import symphra_cache.warming as warming_module
+
+        original_read = warming_module._read_csv_pairs
+        reader_threads: list[int] = []
+
+        def tracking_read(file_path):
+            reader_threads.append(threading.get_ident())
+            return original_read(file_path)
+
+        monkeypatch.setattr(warming_module, "_read_csv_pairs", tracking_read)
+
+        cache = CacheManager(backend=MemoryBackend())
+        warmer = CacheWarmer(cache)
+
+        file_path = tmp_path / "data.csv"
+        file_path.write_text("key,value\nk1,v1\n", encoding="utf-8")
 
-        finally:
-            Path(temp_file).unlink()
+        await warmer.warm_up_from_file(str(file_path), format="csv")
+
+        assert reader_threads
+        assert reader_threads[0] != threading.get_ident()
+        assert cache.get("k1") == "v1"
+
+    @pytest.mark.asyncio
+    async def test_warm_up_from_json_file_stdlib_fallback(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """测试未安装 orjson 时回退到标准库 json"""
+        import symphra_cache.serializers as serializers_module
+
+        monkeypatch.setattr(serializers_module, "_orjson", None)
+
+        cache = CacheManager(backend=MemoryBackend())
+        warmer = CacheWarmer(cache)
+
+        file_path = tmp_path / "data.json"
+        file_path.write_text(json.dumps({"名称": "值", "count": 3}), encoding="utf-8")
+
+        await warmer.warm_up_from_file(str(file_path), format="json")
+
+        assert cache.get("名称") == "值"
+        assert cache.get("count") == 3
+
+    @pytest.mark.asyncio
+    async def test_warm_up_from_json_file_keeps_big_integers(self, tmp_path: Path) -> None:
+        """测试超出 64 位的整数原样预热，不被 orjson 转为浮点数"""
+        cache = CacheManager(backend=MemoryBackend())
+        warmer = CacheWarmer(cache)
+
+        file_path = tmp_path / "data.json"
+        file_path.write_text('{"big": 123456789012345678901234567890}', encoding="utf-8")
+
+        await warmer.warm_up_from_file(str(file_path), format="json")
+
+        assert cache.get("big") == 123456789012345678901234567890
 
     @pytest.mark.asyncio
     async def test_warm_up_from_nonexistent_file(self) -> None:
@@ -314,6 +525,34 @@ class TestCacheWarmerFile:
         assert token_ttl <= 3600
         assert config_ttl <= 7200
 
+    @pytest.mark.asyncio
+    async def test_warm_up_with_ttl_map_shares_concurrency_limit(self) -> None:
+        """测试 TTL 映射预热的各分组共用同一并发上限"""
+        cache = CacheManager(backend=MemoryBackend())
+        warmer = CacheWarmer(cache, batch_size=5, concurrency=2)
+
+        in_flight = 0
+        peak = 0
+        original_aset_many = cache.aset_many
+
+        async def tracking_aset_many(mapping, ttl=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            await original_aset_many(mapping, ttl=ttl)
+            in_flight -= 1
+
+        cache.aset_many = tracking_aset_many
+
+        data = {f"group_key_{i}": i for i in range(60)}
+        ttl_map = {key: 600 + i % 4 for i, key in enumerate(data)}
+        await warmer.warm_up_with_ttl_map(data, ttl_map)
+
+        assert peak == 2
+        assert len(cache) == 60
+        assert cache.ttl("group_key_1") <= 601
+
 
 class TestCacheWarmerStats:
     """测试预热统计功能"""
@@ -333,6 +572,22 @@ class TestCacheWarmerStats:
         assert "hot_keys_count" in stats
         assert "background_tasks_count" in stats
 
+    @pytest.mark.asyncio
+    async def test_finished_background_task_is_released(self) -> None:
+        """测试结束的后台任务自动从任务集合中移除"""
+        cache = CacheManager(backend=MemoryBackend())
+        warmer = CacheWarmer(cache)
+
+        await warmer.start_background_warming(lambda: {}, interval=1.0)
+        task = next(iter(warmer._warming_tasks))
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+
+        assert task not in warmer._warming_tasks
+
     @pytest.mark.asyncio
     async def test_close_warmup(self) -> None:
         """测试关闭预热器"""
@@ -341,11 +596,13 @@ class TestCacheWarmerStats:
 
         # 启动后台任务
         await warmer.start_background_warming(lambda: {}, interval=1.0)
+        tasks = list(warmer._warming_tasks)
 
-        # 关闭应该停止任务
+        # 关闭应该停止任务，并等待其真正结束
         await warmer.close()
 
         assert len(warmer._warming_tasks) == 0
+        assert all(task.done() for task in tasks)
 
 
 class TestCacheWarmerFactory:
@@ -398,6 +655,76 @@ class TestCacheWarmerPerformance:
         # 验证所有数据都已预热
         assert len(cache) == 1000
 
+    @pytest.mark.asyncio
+    async def test_warm_up_iterates_pairs_without_reindexing(self) -> None:
+        """测试分批时直接使用键值对，不再按键回查源数据"""
+
+        class _NoLookupDict(dict):
+            def __getitem__(self, key: object) -> object:
+                raise AssertionError("warm_up 不应按键回查数据")
+
+        cache = CacheManager(backend=MemoryBackend())
+        warmer = CacheWarmer(cache, batch_size=3)
+
+        await warmer.warm_up(_NoLookupDict((f"key_{i}", i) for i in range(10)))
+
+        assert cache.get("key_9") == 9
+
+    @pytest.mark.asyncio
+    async def test_warm_up_concurrency_limit(self) -> None:
+        """测试批量写入并发数受 concurrency 限制"""
+        cache = CacheManager(backend=MemoryBackend())
+        warmer = CacheWarmer(cache, batch_size=10, concurrency=3)
+
+        in_flight = 0
+        peak = 0
+        original_aset_many = cache.aset_many
+
+        async def tracking_aset_many(mapping, ttl=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            await original_aset_many(mapping, ttl=ttl)
+            in_flight -= 1
+
+        cache.aset_many = tracking_aset_many
+
+        data = {f"limit_key_{i}": i for i in range(100)}
+        await warmer.warm_up(data)
+
+        assert peak == 3
+        assert len(cache) == 100
+
+    @pytest.mark.asyncio
+    async def test_warm_up_failure_cancels_pending_batches(self) -> None:
+        """测试某一批次写入失败时取消其余批次并抛出该错误"""
+        cache = CacheManager(backend=MemoryBackend())
+        warmer = CacheWarmer(cache, batch_size=10, concurrency=2)
+
+        calls = 0
+        original_aset_many = cache.aset_many
+
+        async def failing_aset_many(mapping, ttl=None):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise ConnectionError("backend down")
+            await asyncio.sleep(0.01)
+            await original_aset_many(mapping, ttl=ttl)
+
+        cache.aset_many = failing_aset_many
+
+        data = {f"fail_key_{i}": i for i in range(100)}
+        with pytest.raises(ConnectionError, match="backend down"):
+            await warmer.warm_up(data)
+
+        # 失败后没有批次仍在后台写入
+        written = len(cache)
+        await asyncio.sleep(0.05)
+        assert len(cache) == written
+        assert written < 90
+
     @pytest.mark.asyncio
     async def test_incremental_warm_up_performance(self) -> None:
         """测试增量预热性能"""